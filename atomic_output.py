@@ -0,0 +1,137 @@
+"""
+Safe output writes shared by the generators (build_site.py, fetch_scholar.py,
+html_to_docx.py, batch_resumes.py, ...).
+
+- Every file is written to a temp file in the same directory and renamed
+  into place, so readers (the web server, rsync) never see a partial file.
+- A file whose new content hashes the same as what is on disk is left
+  alone, keeping its mtime, so downstream sync stages ship nothing.
+- `build_lock` takes an advisory lock (fcntl.flock on `.build.lock`) so two
+  builds writing into the same directory run one after the other instead of
+  interleaving. Where fcntl is unavailable (Windows) it is a no-op.
+
+Usage:
+    with atomic_output.build_lock(script_dir, timeout=60):
+        changed = atomic_output.write_text("index.html", html_content)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes stay atomic, only the lock is skipped
+    fcntl = None
+
+
+LOCK_FILE = ".build.lock"
+LOCK_TIMEOUT = 300.0   # Seconds to wait for another build; None waits forever, 0 fails at once
+LOCK_POLL_INTERVAL = 0.1
+CHUNK_SIZE = 64 * 1024
+
+
+class LockTimeout(Exception):
+    """Raised when another build holds the lock for longer than the timeout."""
+
+
+@contextmanager
+def build_lock(directory: str, timeout: Optional[float] = LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold the advisory build lock for `directory` for the duration of the block."""
+    if fcntl is None:
+        yield
+        return
+
+    path = os.path.join(directory, LOCK_FILE)
+    with open(path, "a") as lock_file:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waiting = False
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise LockTimeout(f"{path} is held by another build (waited {timeout:g}s)")
+                if not waiting:
+                    print(f"Waiting for another build to release {path}...")
+                    waiting = True
+                time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def file_hash(path: str) -> Optional[str]:
+    """sha256 of a file's contents, or None if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _same_content(tmp_path: str, path: str) -> bool:
+    try:
+        if os.path.getsize(tmp_path) != os.path.getsize(path):
+            return False
+    except FileNotFoundError:
+        return False
+    return file_hash(tmp_path) == file_hash(path)
+
+
+@contextmanager
+def open_atomic(path: str, mode: str = "w", encoding: Optional[str] = "utf-8") -> Iterator[IO]:
+    """Open a temp file next to `path`; on success it replaces `path` unless identical.
+
+    The temp file is removed if the block raises. `changed` on the yielded
+    file object tells the caller afterwards whether `path` was replaced.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=None if "b" in mode else encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if _same_content(tmp_path, path):
+            os.remove(tmp_path)
+            f.changed = False
+            return
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600 files
+        os.replace(tmp_path, path)
+        f.changed = True
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_bytes(path: str, data: bytes) -> bool:
+    """Atomically write `data` to `path`. Returns False if it was already identical."""
+    try:
+        if os.path.getsize(path) == len(data) and file_hash(path) == hashlib.sha256(data).hexdigest():
+            return False
+    except FileNotFoundError:
+        pass
+    with open_atomic(path, "wb") as f:
+        f.write(data)
+    return f.changed
+
+
+def write_text(path: str, text: str, encoding: str = "utf-8") -> bool:
+    """Atomically write `text` to `path`. Returns False if it was already identical."""
+    return write_bytes(path, text.encode(encoding))
+
+
+def write_json(path: str, data: Any, sort_keys: bool = False, ensure_ascii: bool = False) -> bool:
+    """Atomically write `data` as indented JSON (with a trailing newline)."""
+    return write_text(path, json.dumps(data, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys) + "\n")
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Author-name parsing and canonicalization.
+
+Usage:
+    python authors.py --data data.json            # show what would change
+    python authors.py --data data.json --write    # normalize all author lists
+
+"R. Valle", "R Valle", "Valle, Rafael" and "Rafael Valle" all map to the same
+canonical name and author ID. Explicit variants live in author_aliases.json
+({"Canonical Name": ["Variant", ...]}); other names are matched on an
+accent/punctuation-insensitive key, then on first + last name, then on first
+initial + last name when that is unambiguous. Contribution markers such as a
+trailing "*" are kept.
+"""
+
+import argparse
+import json
+import os
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import json_stream
+
+
+ALIASES_FILE = "author_aliases.json"
+
+_SPLIT_LIST = re.compile(r"\s*[;,]\s*|\s+and\s+")
+_SPLIT_SEMICOLON = re.compile(r"\s*;\s*|\s+and\s+")
+_MARKER = re.compile(r"[*†‡\d]+$")  # *, daggers, affiliation numbers
+_NON_WORD = re.compile(r"[^a-z\s]")
+_SPACES = re.compile(r"\s+")
+_LETTER_MAP = str.maketrans({"ł": "l", "Ł": "L", "ø": "o", "Ø": "O", "đ": "d", "Đ": "D", "ß": "ss", "-": " ", ".": " "})
+
+
+@lru_cache(maxsize=None)
+def parse_author_string(author_string: str) -> Tuple[str, ...]:
+    """Split a Scholar/BibTeX author string into raw names.
+
+    "A and B", "A, B, C" and "Last, First; Last, First" are all accepted.
+    """
+    if not author_string:
+        return ()
+    splitter = _SPLIT_SEMICOLON if ";" in author_string else _SPLIT_LIST
+    return tuple(name.strip() for name in splitter.split(author_string) if name.strip())
+
+
+def split_marker(name: str) -> Tuple[str, str]:
+    """Split a trailing contribution marker: "Rafael Valle*" -> ("Rafael Valle", "*")."""
+    name = _SPACES.sub(" ", name.strip())
+    match = _MARKER.search(name)
+    if match and match.start() > 0:
+        return name[:match.start()].rstrip(), match.group()
+    return name, ""
+
+
+def clean_name(name: str) -> str:
+    """Tidy a name without a marker: flip "Last, First" and collapse whitespace."""
+    if "," in name:
+        last, _, first = name.partition(",")
+        name = f"{first.strip()} {last.strip()}"
+    return _SPACES.sub(" ", name).strip()
+
+
+def name_key(name: str) -> str:
+    """Accent-, case- and punctuation-insensitive key: "Adrian Łańcucki" -> "adrian lancucki"."""
+    text = unicodedata.normalize("NFKD", clean_name(name).translate(_LETTER_MAP))
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", text)).strip()
+
+
+def _short_and_initial(key: str) -> Tuple[Optional[str], Optional[str]]:
+    """(first + last, first initial + last) keys, or None for one-word names."""
+    parts = key.split()
+    if len(parts) < 2:
+        return None, None
+    return f"{parts[0]} {parts[-1]}", f"{parts[0][0]} {parts[-1]}"
+
+
+def author_slug(name: str) -> str:
+    """URL-safe author ID: "Rafael Valle" -> "rafael-valle"."""
+    return name_key(name).replace(" ", "-")
+
+
+class AuthorIndex:
+    """Maps raw author names to canonical names, memoizing every lookup."""
+
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None):
+        self._exact: Dict[str, str] = {}
+        self._short: Dict[str, Optional[str]] = {}  # None marks an ambiguous key
+        self._initial: Dict[str, Optional[str]] = {}
+        self._cache: Dict[str, str] = {}
+        for canonical, variants in (aliases or {}).items():
+            self.add(canonical, variants)
+
+    def add(self, canonical: str, variants: List[str] = ()) -> None:
+        """Register a canonical name and explicit variants of it."""
+        self._cache.clear()
+        for name in (canonical, *variants):
+            self._exact[name_key(name)] = canonical
+        short, initial = _short_and_initial(name_key(canonical))
+        for table, key in ((self._short, short), (self._initial, initial)):
+            if key is None:
+                continue
+            if table.get(key, canonical) != canonical:
+                table[key] = None
+            else:
+                table[key] = canonical
+
+    def resolve(self, name: str) -> str:
+        """Canonical name for a raw name without a marker (the cleaned name if unknown)."""
+        cached = self._cache.get(name)
+        if cached is not None:
+            return cached
+
+        key = name_key(name)
+        canonical = self._exact.get(key)
+        if canonical is None:
+            short, initial = _short_and_initial(key)
+            parts = key.split()
+            if short is not None and len(parts[0]) > 1:
+                canonical = self._short.get(short)
+            elif initial is not None:
+                canonical = self._initial.get(initial)
+        if canonical is None:
+            canonical = clean_name(name)
+
+        self._cache[name] = canonical
+        return canonical
+
+    def canonicalize(self, name: str) -> str:
+        """Canonical display name, keeping any contribution marker."""
+        bare, marker = split_marker(name)
+        return self.resolve(bare) + marker
+
+    def author_id(self, name: str) -> str:
+        """Stable author ID for a raw name (markers ignored)."""
+        return author_slug(self.resolve(split_marker(name)[0]))
+
+    def parse(self, author_string: str) -> List[str]:
+        """Split an author string and canonicalize each name."""
+        return [self.canonicalize(name) for name in parse_author_string(author_string)]
+
+
+def load_aliases(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """Load author_aliases.json (empty if missing)."""
+    path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)), ALIASES_FILE)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+@lru_cache(maxsize=None)
+def default_index() -> AuthorIndex:
+    """Shared index built from author_aliases.json."""
+    return AuthorIndex(load_aliases())
+
+
+def learn_catalog(publications: Dict[str, Any], index: AuthorIndex) -> None:
+    """Register the full names seen in a catalog with `index`.
+
+    Spellings that share a first + last name are grouped, and the most
+    common one becomes canonical, so initials and spelling variants
+    resolve to it.
+    """
+    # Group full-name spellings by first + last name
+    spellings: Dict[str, Counter] = {}
+    for pub in publications.values():
+        for name in pub.get("authors", []):
+            bare = split_marker(name)[0]
+            key = name_key(bare)
+            short, _ = _short_and_initial(key)
+            if short is not None and len(key.split()[0]) > 1:
+                spellings.setdefault(short, Counter())[clean_name(bare)] += 1
+
+    for short, counts in sorted(spellings.items()):
+        if index.resolve(short) == clean_name(short):  # Not already known
+            # Prefer the most common spelling, then the one with most detail (accents, middle initials)
+            best = max(counts, key=lambda n: (counts[n], len(n), n))
+            index.add(best, list(counts))
+
+
+def catalog_index(publications: Dict[str, Any]) -> AuthorIndex:
+    """Fresh index built from author_aliases.json plus a catalog's own spellings."""
+    index = AuthorIndex(load_aliases())
+    learn_catalog(publications, index)
+    return index
+
+
+def normalize_catalog(publications: Dict[str, Any], index: AuthorIndex) -> Dict[str, List[Tuple[str, str]]]:
+    """Canonicalize every `authors` list in a catalog, in place.
+
+    Full names seen in the catalog are learned first (see learn_catalog).
+    Returns {pub_id: [(old, new), ...]} for the names that changed.
+    """
+    learn_catalog(publications, index)
+
+    changes = {}
+    for pub_id, pub in publications.items():
+        authors = pub.get("authors", [])
+        normalized = [index.canonicalize(name) for name in authors]
+        diff = [(old, new) for old, new in zip(authors, normalized) if old != new]
+        if diff:
+            pub["authors"] = normalized
+            changes[pub_id] = diff
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Canonicalize author names in a publication data file.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python authors.py --data data.json
+    python authors.py --data data_prefetched.json --write
+        """
+    )
+    parser.add_argument(
+        "--data",
+        default="data.json",
+        help="JSON file containing publication data (default: data.json)"
+    )
+    parser.add_argument(
+        "--write",
+        action="store_true",
+        help="Write the normalized author lists back to the data file"
+    )
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    data_path = os.path.join(script_dir, args.data)
+    publications = dict(json_stream.iter_publications(data_path))
+
+    changes = normalize_catalog(publications, AuthorIndex(load_aliases()))
+
+    for pub_id, diff in changes.items():
+        print(f"{pub_id}:")
+        for old, new in diff:
+            print(f"  {old} -> {new}")
+    print(f"\n{sum(len(d) for d in changes.values())} names to change in {len(changes)} publications")
+
+    if args.write and changes:
+        # Only the changed author lists are rewritten; the file keeps its layout
+        json_stream.rewrite_field(data_path, "authors", {pub_id: publications[pub_id]["authors"] for pub_id in changes})
+        print(f"Wrote {args.data}")
+
+
+if __name__ == "__main__":
+    main()
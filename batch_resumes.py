@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Render every resume variant to DOCX and HTML in parallel.
+
+Usage:
+    python batch_resumes.py                        # all resume*.md -> build/resumes/
+    python batch_resumes.py "resume_c*.md" --formats html
+    python batch_resumes.py --force                # ignore the cache
+
+Each markdown file is parsed once and rendered on a process pool. Outputs
+whose source (and renderer code) hash is unchanged since the last run are
+skipped; hashes are kept in build/resumes/.hashes.json. Resumes with a
+generated publications list are re-rendered only when the entries they
+select from data.json change.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import atomic_output
+import resume_markdown
+import resume_publications
+
+
+OUTPUT_DIR = "build/resumes"
+HASHES_FILE = ".hashes.json"
+FORMATS = ("docx", "html")
+
+# Code that affects the rendered output; changing it invalidates the cache
+RENDERER_FILES = ("resume_markdown.py", "resume_publications.py", "html_to_docx.py", "view_resume.py", "batch_resumes.py")
+
+
+def renderer_hash(script_dir: Path) -> str:
+    """Hash of the renderer sources."""
+    digest = hashlib.sha256()
+    for name in RENDERER_FILES:
+        digest.update((script_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def source_hash(md_path: Path, renderer: str) -> str:
+    """Cache key for one markdown file: its bytes, the renderer hash and the
+    publications its directives select from data.json (if any)."""
+    source = md_path.read_bytes()
+    publications = resume_publications.fingerprint(resume_markdown.parse(source.decode("utf-8")))
+    return hashlib.sha256(source + renderer.encode() + publications.encode()).hexdigest()
+
+
+def load_hashes(out_dir: Path) -> Dict[str, Dict[str, str]]:
+    """{markdown file name: {format: source hash}} from the last run."""
+    path = out_dir / HASHES_FILE
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_hashes(out_dir: Path, hashes: Dict[str, Dict[str, str]]) -> None:
+    atomic_output.write_json(str(out_dir / HASHES_FILE), hashes, sort_keys=True, ensure_ascii=True)
+
+
+def render_resume(md_path: str, out_dir: str, formats: List[str]) -> Dict[str, Any]:
+    """Parse one resume and write the requested formats (runs in a worker process).
+
+    Returns {"parse": seconds, format: seconds or error message}.
+    """
+    timings: Dict[str, Any] = {}
+    stem = Path(md_path).stem
+
+    start = time.perf_counter()
+    try:
+        document = resume_markdown.parse_file(Path(md_path))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        return {"parse": error, **{fmt: error for fmt in formats}}
+    timings["parse"] = time.perf_counter() - start
+
+    for fmt in formats:
+        start = time.perf_counter()
+        output_path = Path(out_dir) / f"{stem}.{fmt}"
+        try:
+            if fmt == "docx":
+                from html_to_docx import create_resume_docx  # needs python-docx
+                create_resume_docx(Path(md_path), output_path, document)
+            else:
+                from view_resume import document_to_html, html_page
+                atomic_output.write_text(str(output_path), html_page(document_to_html(document)))
+        except Exception as e:
+            timings[fmt] = f"{type(e).__name__}: {e}"
+            continue
+        timings[fmt] = time.perf_counter() - start
+
+    return timings
+
+
+def format_cell(value: Any) -> str:
+    if value is None:
+        return "skipped"
+    if isinstance(value, str):
+        return "FAILED"
+    return f"{value * 1000:.0f} ms"
+
+
+def render_batch(md_paths: List[Path], out_dir: Path, formats: List[str], workers: int, force: bool) -> List[str]:
+    """Render the stale outputs of md_paths and print a timing table.
+
+    Returns failure messages. A resume with any failed format gets no
+    hashes recorded, so the next run renders it again in full. Callers
+    hold the build lock for out_dir.
+    """
+    script_dir = Path(__file__).parent
+    hashes = {} if force else load_hashes(out_dir)
+    renderer = renderer_hash(script_dir)
+
+    # Decide what is stale before starting any workers
+    jobs: List[Tuple[Path, Optional[str], List[str]]] = []
+    for md_path in md_paths:
+        try:
+            key: Optional[str] = source_hash(md_path, renderer)
+        except Exception:
+            key = None  # render it anyway so the worker reports the error
+        previous = hashes.get(md_path.name, {})
+        stale = [
+            fmt for fmt in formats
+            if previous.get(fmt) != key or not (out_dir / f"{md_path.stem}.{fmt}").exists()
+        ]
+        jobs.append((md_path, key, stale))
+
+    start = time.perf_counter()
+    results: Dict[str, Dict[str, Any]] = {}
+    todo = [(md_path, key, stale) for md_path, key, stale in jobs if stale]
+    if todo:
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            futures = {
+                md_path.name: pool.submit(render_resume, str(md_path), str(out_dir), stale)
+                for md_path, _, stale in todo
+            }
+            results = {name: future.result() for name, future in futures.items()}
+    elapsed = time.perf_counter() - start
+
+    # Timing table
+    failures = []
+    print(f"{'File':<30} {'parse':>8} " + " ".join(f"{fmt:>8}" for fmt in formats))
+    for md_path, key, stale in jobs:
+        timings = results.get(md_path.name, {})
+        row = [f"{md_path.name:<30}", f"{format_cell(timings.get('parse')):>8}"]
+        failed = [fmt for fmt in formats if isinstance(timings.get(fmt), str)]
+        for fmt in formats:
+            value = timings.get(fmt)
+            row.append(f"{format_cell(value):>8}")
+            if fmt in failed:
+                failures.append(f"{md_path.name} -> {fmt}: {value}")
+            elif value is not None and not failed and key is not None:
+                hashes.setdefault(md_path.name, {})[fmt] = key
+        if failed:
+            hashes.pop(md_path.name, None)
+        print(" ".join(row))
+
+    rendered = sum(1 for timings in results.values() for fmt in formats if isinstance(timings.get(fmt), float))
+    print(f"\n{rendered} file(s) rendered in {elapsed:.2f}s to {out_dir}/")
+
+    save_hashes(out_dir, hashes)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render resume markdown files to DOCX and HTML in parallel.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python batch_resumes.py
+    python batch_resumes.py "resume_c*.md" --formats html
+    python batch_resumes.py --workers 2 --force
+        """
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        default=["resume*.md"],
+        help="Markdown files or glob patterns (default: resume*.md)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=OUTPUT_DIR,
+        help=f"Where to write the rendered files (default: {OUTPUT_DIR})"
+    )
+    parser.add_argument(
+        "--formats",
+        default=",".join(FORMATS),
+        help=f"Comma-separated output formats (default: {','.join(FORMATS)})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render everything, even if unchanged"
+    )
+    parser.add_argument(
+        "--lock-timeout",
+        type=float,
+        default=atomic_output.LOCK_TIMEOUT,
+        help=f"Seconds to wait for another run writing the same directory (default: {atomic_output.LOCK_TIMEOUT:g})"
+    )
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    unknown = sorted(set(formats) - set(FORMATS))
+    if unknown:
+        parser.error(f"Unknown format(s): {', '.join(unknown)} (expected {', '.join(FORMATS)})")
+
+    md_paths = sorted({
+        Path(path) for pattern in args.patterns
+        for path in glob.glob(str(script_dir / pattern) if not os.path.isabs(pattern) else pattern)
+    })
+    if not md_paths:
+        print(f"No markdown files match: {' '.join(args.patterns)}")
+        return
+
+    out_dir = script_dir / args.output_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Hold the lock from reading the hashes to saving them, so concurrent runs
+    # neither render the same files at once nor drop each other's hashes
+    try:
+        with atomic_output.build_lock(str(out_dir), args.lock_timeout):
+            failures = render_batch(md_paths, out_dir, formats, args.workers, args.force)
+    except atomic_output.LockTimeout as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    for failure in failures:
+        print(f"Error: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark for the abstract/BibTeX toggles on large publication lists.
+
+Usage:
+    python bench_toggles.py                      # 100, 1,000 and 10,000 rows
+    python bench_toggles.py --rows 10000 --runs 5 --baseline
+    python bench_toggles.py --output-dir /tmp/bench --no-browser
+
+Builds synthetic pages with the same row markup, toggle CSS and
+js/hidebib.js as index.html, loads each in headless Chromium and reports
+time to DOMContentLoaded, the time spent in the head scripts and in the
+scripts at the end of the body, and the time from a toggle click until the
+abstract is visible. With the delegated click handler, nothing runs at the
+end of the body, so that time stays flat as the row count grows. --baseline also measures the previous handler (per-row javascript:
+links and a load-time pass that hid every abstract and BibTeX block).
+
+Requires: pip install playwright && playwright install chromium
+(or --chromium PATH for an existing Chrome/Chromium binary; without
+playwright, the pages are written to --output-dir for manual testing).
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from build_site import JS_CLASS_SCRIPT, TOGGLE_CSS, render_publication
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+
+CONFIG = {"ownerName": "Rafael Valle", "highlightColor": "deeppink"}
+
+HANDLERS = ("delegated", "baseline")
+
+# Marks around the scripts that run while the page loads (in the head and at
+# the end of the body), so their run time can be measured in the page
+HEAD_START = "<script>performance.mark('head-start');</script>"
+HEAD_END = "<script>performance.mark('head-end');</script>"
+BODY_START = "<script>performance.mark('body-start');</script>"
+BODY_END = "<script>performance.mark('body-end');</script>"
+
+# The handler before event delegation: per-row javascript: links, and a pass
+# at the end of the body that hid every BibTeX block and abstract
+BASELINE_HIDEBIB_JS = """function hideallbibs()
+{
+    var el = document.getElementsByTagName("div") ;
+    for (var i = 0 ; i < el.length ; ++i) {
+        if (el[i].className == "paper") {
+            var bib = el[i].getElementsByTagName("pre") ;
+            if (bib.length > 0) {
+                bib [0] .style.display = 'none' ;
+            }
+        }
+    }
+}
+function ishidden(el) { return window.getComputedStyle(el).display == 'none' ; }
+function togglebib(paperid)
+{
+    var bib = document.getElementById(paperid).getElementsByTagName('pre') ;
+    if (bib.length > 0) {
+        bib [0] .style.display = ishidden(bib [0]) ? 'block' : 'none' ;
+    }
+}
+function toggleblock(blockId)
+{
+   var block = document.getElementById(blockId);
+   block.style.display = ishidden(block) ? 'block' : 'none' ;
+}
+function hideblock(blockId) { document.getElementById(blockId).style.display = 'none' ; }"""
+
+BASELINE_INIT = """<script>
+if (typeof hideallbibs === 'function') {
+  hideallbibs();
+}
+document.querySelectorAll('[id$="_abs"]').forEach(el => {
+  if (typeof hideblock === 'function') {
+    hideblock(el.id);
+  }
+});
+</script>"""
+
+# Clicks the last row's abstract link and waits (one frame at a time) until
+# the abstract is visible; javascript: links run as a separate task
+METRICS_JS = """async (selector) => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const head = performance.measure('head', 'head-start', 'head-end').duration;
+    const body = performance.measure('body', 'body-start', 'body-end').duration;
+    const links = document.querySelectorAll(selector);
+    const link = links[links.length - 1];
+    const abstract = link.closest('div.paper').querySelector('p > i');
+    const start = performance.now();
+    link.click();
+    let shown = false;
+    for (let frame = 0; frame < 60 && !shown; frame++) {
+        shown = getComputedStyle(abstract).display !== 'none';
+        if (!shown) {
+            await new Promise(resolve => requestAnimationFrame(resolve));
+        }
+    }
+    return {
+        dcl: nav.domContentLoadedEventEnd,
+        head: head,
+        body: body,
+        click: performance.now() - start,
+        shown: shown,
+    };
+}"""
+
+LINK_SELECTORS = {
+    "delegated": 'a[data-toggle="abstract"]',
+    "baseline": 'a[href^="javascript:toggleblock"]',
+}
+
+
+def baseline_row(row: str, pub_id: str) -> str:
+    """Rewrite a row's toggle links and abstract to the pre-delegation markup."""
+    lower_id = pub_id.lower()
+    row = row.replace(f'<a href="#{lower_id}" data-toggle="abstract">', f"<a href=\"javascript:toggleblock('{lower_id}_abs')\">")
+    row = row.replace(f'<a href="#{lower_id}" data-toggle="bibtex" class="togglebib">', f"<a href=\"javascript:togglebib('{lower_id}')\" class=\"togglebib\">")
+    return row.replace('<i class="abstract">', f'<i id="{lower_id}_abs">', 1)
+
+
+def synthetic_page(rows: int, handler: str = "delegated") -> str:
+    """A page of `rows` publications with abstracts and BibTeX, and no remote assets."""
+    body = []
+    for i in range(rows):
+        pub_id = f"PAPER{i}"
+        pub = {
+            "title": f"Synthetic Paper {i}: A Study of Toggles at Scale",
+            "authors": ["Rafael Valle", f"Author {i % 97}", f"Author {i % 89}"],
+            "venue": "ICLR",
+            "year": 2000 + i % 26,
+            "links": {"arxiv": f"https://arxiv.org/abs/2401.{i:05d}"},
+            "abstract": "We measure how page startup cost scales with the number of rows. " * 4,
+            "bibtex": f"@article{{paper{i},\n  title={{Synthetic Paper {i}}},\n  year={{{2000 + i % 26}}}\n}}",
+        }
+        row = render_publication(pub_id, pub, CONFIG, False)
+        body.append(baseline_row(row, pub_id) if handler == "baseline" else row)
+
+    if handler == "baseline":
+        style, head_scripts, body_scripts = "", '<script type="text/javascript" src="js/hidebib_baseline.js"></script>', BASELINE_INIT
+    else:
+        style, head_scripts, body_scripts = TOGGLE_CSS, f'{JS_CLASS_SCRIPT}\n  <script type="text/javascript" src="js/hidebib.js"></script>', ""
+    return f'''<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN">
+<html>
+<head>
+  <meta charset="UTF-8">
+  <style type="text/css">
+{style}
+  </style>
+  {HEAD_START}
+  {head_scripts}
+  {HEAD_END}
+</head>
+<body>
+<table width="100%" align="center" border="0" cellspacing="0" cellpadding="20">
+{chr(10).join(body)}
+</table>
+{BODY_START}
+{body_scripts}
+{BODY_END}
+</body>
+</html>
+'''
+
+
+def write_pages(out_dir: Path, row_counts: List[int], handlers: List[str]) -> Dict[Tuple[str, int], Path]:
+    """Write one synthetic page per (handler, row count), next to each handler's script."""
+    script_dir = Path(__file__).parent
+    (out_dir / "js").mkdir(parents=True, exist_ok=True)
+    shutil.copy(script_dir / "js" / "hidebib.js", out_dir / "js" / "hidebib.js")
+    (out_dir / "js" / "hidebib_baseline.js").write_text(BASELINE_HIDEBIB_JS, encoding="utf-8")
+    pages = {}
+    for handler in handlers:
+        for rows in row_counts:
+            path = out_dir / (f"toggles-{rows}.html" if handler == "delegated" else f"toggles-{handler}-{rows}.html")
+            path.write_text(synthetic_page(rows, handler), encoding="utf-8")
+            pages[handler, rows] = path
+    return pages
+
+
+def measure(pages: Dict[Tuple[str, int], Path], runs: int, executable: Optional[str] = None) -> Dict[Tuple[str, int], Dict[str, float]]:
+    """Median metrics per (handler, row count) over `runs` fresh page loads."""
+    results = {}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(executable_path=executable)
+        # One untimed load first, so the first measured page doesn't pay for browser warm-up
+        page = browser.new_page()
+        page.goto(next(iter(pages.values())).as_uri(), wait_until="load")
+        page.close()
+        for (handler, rows), path in pages.items():
+            samples = []
+            for _ in range(runs):
+                page = browser.new_page()
+                page.goto(path.as_uri(), wait_until="load")
+                samples.append(page.evaluate(METRICS_JS, LINK_SELECTORS[handler]))
+                page.close()
+            if not all(sample["shown"] for sample in samples):
+                raise RuntimeError(f"Toggle did not show the abstract on the {rows}-row {handler} page")
+            results[handler, rows] = {key: statistics.median(s[key] for s in samples) for key in ("dcl", "head", "body", "click")}
+        browser.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure abstract/BibTeX toggle startup cost on synthetic pages.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python bench_toggles.py
+    python bench_toggles.py --rows 10000 --runs 5 --baseline
+    python bench_toggles.py --chromium /path/to/chrome-headless-shell
+    python bench_toggles.py --output-dir /tmp/bench --no-browser
+        """
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        action="append",
+        help="Rows per page; repeat for several sizes (default: 100, 1000, 10000)"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Page loads per size; the median is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help="Also measure the previous per-row handler, for comparison"
+    )
+    parser.add_argument(
+        "--chromium",
+        metavar="PATH",
+        help="Chrome/Chromium binary to use instead of playwright's own"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Keep the generated pages here (default: a temporary directory, or build/bench_toggles with --no-browser)"
+    )
+    parser.add_argument(
+        "--no-browser",
+        action="store_true",
+        help="Only write the pages"
+    )
+    args = parser.parse_args()
+
+    row_counts = args.rows or [100, 1000, 10000]
+    handlers = list(HANDLERS) if args.baseline else ["delegated"]
+    if args.no_browser or sync_playwright is None:
+        if sync_playwright is None and not args.no_browser:
+            print("playwright is not installed (pip install playwright && playwright install chromium);")
+            print("writing the pages only.")
+        out_dir = Path(args.output_dir or "build/bench_toggles")
+        for (handler, rows), path in write_pages(out_dir, row_counts, handlers).items():
+            print(f"  {handler:>9} {rows:>6} rows: {path} ({os.path.getsize(path):,} bytes)")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pages = write_pages(Path(args.output_dir or tmp_dir), row_counts, handlers)
+        results = measure(pages, args.runs, args.chromium)
+
+    print(f"{'Handler':>9} {'Rows':>7} {'DOMContentLoaded':>17} {'head scripts':>13} {'body scripts':>13} {'click to shown':>15}")
+    for (handler, rows), result in results.items():
+        print(f"{handler:>9} {rows:>7} {result['dcl']:>14.1f} ms {result['head']:>10.1f} ms "
+              f"{result['body']:>10.1f} ms {result['click']:>12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
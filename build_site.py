@@ -11,10 +11,21 @@ publications from the specified JSON data file and site.json structure.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import html
-from typing import Any, Dict, List
+import re
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import atomic_output
+import citation_store
+import selection
+from authors import AuthorIndex, author_slug, catalog_index, default_index as author_index, split_marker
+
+
+INDEX_DIR = "pages"  # Author/venue/year listing pages
 
 
 def load_json(filepath: str) -> Dict[str, Any]:
@@ -24,10 +35,12 @@ def load_json(filepath: str) -> Dict[str, Any]:
 
 
 def highlight_author(authors: List[str], owner_name: str, color: str) -> str:
-    """Highlight the owner's name in the author list."""
+    """Highlight the owner's name (or any alias of it) in the author list."""
+    index = author_index()
+    owner_id = index.author_id(owner_name)
     result = []
     for author in authors:
-        if owner_name in author:
+        if index.author_id(author) == owner_id:
             result.append(f'<strong style="color: {color};">{html.escape(author)}</strong>')
         else:
             result.append(html.escape(author))
@@ -92,6 +105,30 @@ def create_links_html(links: Dict[str, str], pub_id: str) -> str:
     return " | ".join(link_parts)
 
 
+def media_urls(pub: Dict[str, Any]) -> List[str]:
+    """List the media sources (images, iframes, audio) a publication entry embeds."""
+    urls = []
+    media = pub.get("media") or {}
+    for key in ("src", "image_src", "audio_src", "youtube_src"):
+        if media.get(key):
+            urls.append(media[key])
+    for sample in media.get("audio_samples", []):
+        if sample.get("src"):
+            urls.append(sample["src"])
+    return urls
+
+
+def publication_urls(pub: Dict[str, Any]) -> List[str]:
+    """List every URL or local path a publication entry emits, in render order."""
+    urls = media_urls(pub)
+    links = pub.get("links") or {}
+    for key in ("paper", "arxiv", "website", "code", "audio"):
+        if links.get(key):
+            urls.append(links[key])
+
+    return urls
+
+
 def render_news(section: Dict[str, Any], publications: Dict[str, Any]) -> str:
     """Render the news section."""
     items = []
@@ -108,7 +145,7 @@ def render_news(section: Dict[str, Any], publications: Dict[str, Any]) -> str:
     return "\n".join(items)
 
 
-def render_publication(pub_id: str, pub: Dict[str, Any], config: Dict[str, str], is_new: bool) -> str:
+def render_publication(pub_id: str, pub: Dict[str, Any], config: Dict[str, str], is_new: bool, citations: Optional[int] = None) -> str:
     """Render a single publication entry."""
     lower_id = pub_id.lower()
 
@@ -130,6 +167,8 @@ def render_publication(pub_id: str, pub: Dict[str, Any], config: Dict[str, str],
         if pub.get("year"):
             venue_html += f' {pub["year"]}'
         venue_html += "<br>"
+    if citations:
+        venue_html += f"cited by {citations}<br>"
 
     # Links and abstract/bibtex
     links_html = create_links_html(links, pub_id)
@@ -140,16 +179,17 @@ def render_publication(pub_id: str, pub: Dict[str, Any], config: Dict[str, str],
     div_parts = []
     if links_html:
         div_parts.append(links_html)
+    # Handled by one delegated click listener in js/hidebib.js
     if has_abstract:
-        div_parts.append(f"<a href=\"javascript:toggleblock('{lower_id}_abs')\">abstract</a>")
+        div_parts.append(f'<a href="#{lower_id}" data-toggle="abstract">abstract</a>')
     if has_bibtex:
-        div_parts.append(f"<a shape=\"rect\" href=\"javascript:togglebib('{lower_id}')\" class=\"togglebib\">bibtex</a>")
+        div_parts.append(f'<a href="#{lower_id}" data-toggle="bibtex" class="togglebib">bibtex</a>')
 
     div_content = " | ".join(div_parts)
 
     abstract_html = ""
     if has_abstract:
-        abstract_html = f'<p align="justify"><i id="{lower_id}_abs">{html.escape(pub["abstract"])}</i></p>'
+        abstract_html = f'<p align="justify"><i class="abstract">{html.escape(pub["abstract"])}</i></p>'
 
     bibtex_html = ""
     if has_bibtex:
@@ -174,52 +214,242 @@ def render_publication(pub_id: str, pub: Dict[str, Any], config: Dict[str, str],
   </tr>'''
 
 
-def render_publications(section: Dict[str, Any], publications: Dict[str, Any], config: Dict[str, str], new_badge_ids: List[str]) -> str:
-    """Render all publications."""
-    rows = []
-    for pub_id in section.get("entries", []):
+JSONLD_MODES = ("consolidated", "inline", "none")
+JSONLD_CONTEXT = "https://schema.org"
+_JSONLD_ESCAPES = {"<": "\\u003c", ">": "\\u003e", "&": "\\u0026"}
+
+
+def scholarly_article(pub_id: str, pub: Dict[str, Any], index: Optional[AuthorIndex] = None) -> Dict[str, Any]:
+    """schema.org ScholarlyArticle for a publication, identified by its row anchor (#ID).
+
+    Authors are named by their canonical name in `index` (default: the
+    alias-only index; build_outputs passes the catalog index).
+    """
+    index = index or author_index()
+    links = pub.get("links") or {}
+    url = links.get("website") or links.get("paper") or links.get("arxiv")
+
+    article = {"@type": "ScholarlyArticle", "@id": f"#{pub_id}", "name": pub.get("title", "")}
+    if pub.get("authors"):
+        article["author"] = [{"@type": "Person", "name": index.resolve(split_marker(author)[0])} for author in pub["authors"]]
+    if pub.get("year"):
+        article["datePublished"] = str(pub["year"])
+    if pub.get("venue"):
+        article["isPartOf"] = {"@type": "Periodical", "name": pub["venue"]}
+    if url:
+        article["url"] = url
+    same_as = []
+    for key in ("paper", "arxiv", "website", "code"):
+        if links.get(key) and links[key] != url and links[key] not in same_as:
+            same_as.append(links[key])
+    if same_as:
+        article["sameAs"] = same_as
+    return article
+
+
+def jsonld_script(value: Dict[str, Any]) -> str:
+    """Compact <script type="application/ld+json"> block.
+
+    <, > and & are \\u-escaped, so no field can close the script element.
+    """
+    text = json.dumps({"@context": JSONLD_CONTEXT, **value}, ensure_ascii=False, separators=(",", ":"))
+    for char, escape in _JSONLD_ESCAPES.items():
+        text = text.replace(char, escape)
+    return f'<script type="application/ld+json">{text}</script>'
+
+
+def jsonld_references(pub_ids: List[str], articles: Dict[str, Dict[str, Any]], home: str) -> str:
+    """ItemList pointing at articles already described in full on the main page."""
+    items = [
+        {"@type": "ListItem", "position": position, "item": {"@id": home + articles[pub_id]["@id"]}}
+        for position, pub_id in enumerate((pub_id for pub_id in pub_ids if pub_id in articles), start=1)
+    ]
+    return jsonld_script({"@type": "ItemList", "itemListElement": items}) if items else ""
+
+
+def render_publication_rows(entry_ids: List[str], publications: Dict[str, Any], config: Dict[str, str], new_badge_ids: List[str], citations: Optional[Dict[str, int]] = None, articles: Optional[Dict[str, Dict[str, Any]]] = None, names: Optional[AuthorIndex] = None) -> Dict[str, str]:
+    """Render each listed publication once, keyed by ID (in listing order).
+
+    If an `articles` dict is given, it is filled with each row's
+    ScholarlyArticle (see scholarly_article, with author index `names`) in
+    the same pass.
+    """
+    citations = citations or {}
+    rows = {}
+    for pub_id in entry_ids:
         pub = publications.get(pub_id)
         if not pub:
             print(f"Warning: Publication not found: {pub_id}")
             continue
 
         is_new = pub_id in new_badge_ids
-        rows.append(render_publication(pub_id, pub, config, is_new))
+        rows[pub_id] = render_publication(pub_id, pub, config, is_new, citations.get(pub_id))
+        if articles is not None:
+            articles[pub_id] = scholarly_article(pub_id, pub, names)
 
-    return "\n".join(rows)
+    return rows
 
 
-def build_html(data_file: str, site_file: str = "site.json") -> str:
-    """Build the complete HTML page."""
+def render_publications(section: Dict[str, Any], publications: Dict[str, Any], config: Dict[str, str], new_badge_ids: List[str], citations: Optional[Dict[str, int]] = None) -> str:
+    """Render all publications."""
+    rows = render_publication_rows(section.get("entries", []), publications, config, new_badge_ids, citations)
+    return "\n".join(rows.values())
 
-    # Load data
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data = load_json(os.path.join(script_dir, data_file))
-    site = load_json(os.path.join(script_dir, site_file))
 
-    publications = data.get("publications", {})
-    config = site.get("config", {"ownerName": "Rafael Valle", "highlightColor": "deeppink"})
-    new_badge_ids = site.get("newBadgeIds", [])
+def slugify(text: str) -> str:
+    """Lowercase, dash-separated file-name slug."""
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "unknown"
 
-    # Render sections
-    news_html = ""
-    publications_html = ""
 
-    for section in site.get("sections", []):
-        if section["type"] == "news":
-            news_html = render_news(section, publications)
-        elif section["type"] == "publications":
-            publications_html = render_publications(section, publications, config, new_badge_ids)
+def build_indexes(entry_ids: List[str], publications: Dict[str, Any], index: Optional[AuthorIndex] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Build author/venue/year -> publications indexes in one pass over the entries.
 
-    # Build full HTML
-    html_template = f'''<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN">
+    Authors are bucketed by author ID under their canonical name, resolved
+    with `index` (default: catalog_index(publications)).
+    Returns {kind: {slug: {"label": str, "ids": [pub_id, ...]}}}, with IDs in
+    listing order.
+    """
+    index = index or catalog_index(publications)
+    indexes = {"author": {}, "venue": {}, "year": {}}
+
+    def add(kind: str, label: str, pub_id: str) -> None:
+        slug = (author_slug(label) or "unknown") if kind == "author" else slugify(label)
+        bucket = indexes[kind].setdefault(slug, {"label": label, "ids": []})
+        if not bucket["ids"] or bucket["ids"][-1] != pub_id:
+            bucket["ids"].append(pub_id)
+
+    for pub_id in entry_ids:
+        pub = publications.get(pub_id)
+        if not pub:
+            continue
+        for author in pub.get("authors", []):
+            add("author", index.resolve(split_marker(author)[0]), pub_id)
+        if pub.get("venue"):
+            add("venue", pub["venue"], pub_id)
+        if pub.get("year"):
+            add("year", str(pub["year"]), pub_id)
+
+    return indexes
+
+
+INDEX_KINDS = [("year", "Year"), ("venue", "Venue"), ("author", "Author")]
+
+
+def render_index_page(title: str, heading_html: str, body_html: str, base_href: str, home: str, jsonld_html: str = "") -> str:
+    """Render a standalone listing page that shares the main page's styles."""
+    return f'''<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN">
 <html>
 
-<head>
+{render_head(title, base_href)}
+
+<body>
+<table width="840" border="0" align="center" cellspacing="0" cellpadding="20">
+  <tr><td>
+  <p><a href="{home}">Home</a> &raquo; <a href="{INDEX_DIR}/index.html">Publication index</a></p>
+
+<table width="100%" align="center" border="0" cellspacing="0" cellpadding="20">
+  <tr><td><sectionheading>{heading_html}</sectionheading></td></tr>
+</table>
+{body_html}
+{jsonld_html}
+</td></tr>
+</table>
+</body>
+
+</html>
+'''
+
+
+def render_index_pages(indexes: Dict[str, Dict[str, Dict[str, Any]]], rows: Dict[str, str], owner_name: str, home: str, articles: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, str]:
+    """Render one page per author, venue and year plus an overview page.
+
+    Pages join the already-rendered rows, so no publication is rendered twice.
+    Structured data is described in full only on the main page; with
+    `articles`, each index page lists its entries by reference.
+    Returns {path relative to the site root: html}.
+    """
+    pages = {}
+    base_href = "../"
+    overview = []
+
+    for kind, kind_label in INDEX_KINDS:
+        buckets = indexes[kind]
+        if kind == "year":
+            ordered = sorted(buckets.items(), key=lambda item: item[0], reverse=True)
+        else:
+            ordered = sorted(buckets.items(), key=lambda item: (-len(item[1]["ids"]), item[1]["label"].lower()))
+
+        links = []
+        for slug, bucket in ordered:
+            path = f"{INDEX_DIR}/{kind}-{slug}.html"
+            label = html.escape(bucket["label"])
+            table = "\n".join(rows[pub_id] for pub_id in bucket["ids"] if pub_id in rows)
+            pages[path] = render_index_page(
+                f"{owner_name} - {kind_label}: {bucket['label']}",
+                f"{kind_label}: {label}",
+                f'<table width="100%" align="center" border="0" cellspacing="0" cellpadding="20">\n{table}\n</table>',
+                base_href,
+                home,
+                jsonld_references(bucket["ids"], articles, home) if articles else "",
+            )
+            links.append(f'<a href="{path}">{label}</a> ({len(bucket["ids"])})')
+
+        overview.append(f"<p><b>By {kind_label.lower()}</b>: " + ", ".join(links) + "</p>")
+
+    pages[f"{INDEX_DIR}/index.html"] = render_index_page(
+        f"{owner_name} - Publication index",
+        "Publication index",
+        '<table width="100%" align="center" border="0" cellspacing="0" cellpadding="20">\n  <tr><td>\n' + "\n".join(overview) + "\n  </td></tr>\n</table>",
+        base_href,
+        home,
+    )
+    return pages
+
+
+def render_citation_summary(summary: Optional[Dict[str, Any]]) -> str:
+    """Render the total citations / h-index line under the Publications heading."""
+    if not summary:
+        return ""
+    return f'<br>{summary["total"]} citations, h-index {summary["h_index"]} (as of {summary["fetched_at"][:10]})'
+
+
+# Head/body fragments that --optimize-head swaps out (see optimize_page)
+ICON_STYLESHEETS = [
+    # (CDN URL, SRI hash)
+    ("https://cdnjs.cloudflare.com/ajax/libs/academicons/1.8.6/css/academicons.min.css",
+     "sha256-uFVgMKfistnJAfoCUQigIl+JfUaP47GrRKjf6CTPVmw="),
+    ("https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.11.2/css/all.min.css",
+     "sha256-+N4/V/SbAFiW1MPBCXnfnP9QSN3+Keu+NlB+0ev/YKQ="),
+]
+ICON_LINKS = "\n".join(
+    f'  <link rel="stylesheet" href="{url}" integrity="{sri}" crossorigin="anonymous">'
+    for url, sri in ICON_STYLESHEETS
+)
+FONT_LINK = "<link href='https://fonts.googleapis.com/css?family=Titillium+Web:400,600,400italic,600italic,300,300italic' rel='stylesheet' type='text/css'>"
+HIDEBIB_SCRIPT = '<script type="text/javascript" src="js/hidebib.js"></script>'
+SCRAMBLE_SCRIPT = '<script src="js/scramble.js"></script>'
+EMAIL_SCRAMBLE = """emailScramble = new scrambledString(document.getElementById('email'),
+        'emailScramble', 'lfbkae@araeeeyvlled.lure',
+        [5, 2, 12, 15, 7, 13, 11, 3, 14, 1, 4, 10, 16, 19, 6, 8, 17, 21, 22, 20, 9, 23, 0, 18]);"""
+
+# Abstracts/BibTeX are shown by classes that js/hidebib.js toggles on div.paper.
+# They start hidden only once the `js` class is set, so they stay readable without JS.
+TOGGLE_CSS = """  .js div.paper .abstract, .js div.paper pre {
+    display: none
+  }
+  .js div.paper.show-abstract .abstract, .js div.paper.show-bibtex pre {
+    display: block
+  }"""
+JS_CLASS_SCRIPT = "<script>document.documentElement.className += ' js';</script>"
+
+
+def render_head(title: str, base_href: str = "") -> str:
+    """Render the shared <head> block (styles, fonts, scripts)."""
+    base_html = f'\n  <base href="{base_href}">' if base_href else ""
+    return f'''<head>
   <meta charset="UTF-8">
   <meta name="generator" content="HTML Tidy for Linux/x86 (vers 11 February 2007), see www.w3.org">
-  <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/academicons/1.8.6/css/academicons.min.css" integrity="sha256-uFVgMKfistnJAfoCUQigIl+JfUaP47GrRKjf6CTPVmw=" crossorigin="anonymous">
-  <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.11.2/css/all.min.css" integrity="sha256-+N4/V/SbAFiW1MPBCXnfnP9QSN3+Keu+NlB+0ev/YKQ=" crossorigin="anonymous">
+{ICON_LINKS}
 
   <style type="text/css">
   /* Design Credits: Deepak Pathak, Jon Barron and Abhishek Kar and Saurabh Gupta*/
@@ -256,12 +486,14 @@ def build_html(data_file: str, site_file: str = "site.json") -> str:
     font-size: 22px;
     font-weight: 600
   }}
+{TOGGLE_CSS}
   </style>
+  {JS_CLASS_SCRIPT}
   <link rel="icon" type="image/png" href="images/seal_icon.png">
-  <script type="text/javascript" src="js/hidebib.js"></script>
-  <title>Rafael Valle</title>
+  {HIDEBIB_SCRIPT}
+  <title>{html.escape(title)}</title>{base_html}
   <meta name="Rafael Valle's Homepage" http-equiv="Content-Type" content="Rafael Valle's Homepage">
-  <link href='https://fonts.googleapis.com/css?family=Titillium+Web:400,600,400italic,600italic,300,300italic' rel='stylesheet' type='text/css'>
+  {FONT_LINK}
   <!-- Start : Google Analytics Code -->
   <script>
     (function(i,s,o,g,r,a,m){{i['GoogleAnalyticsObject']=r;i[r]=i[r]||function(){{
@@ -273,8 +505,264 @@ def build_html(data_file: str, site_file: str = "site.json") -> str:
   </script>
   <!-- End : Google Analytics Code -->
   <!-- Scramble Script by Jeff Donahue -->
-  <script src="js/scramble.js"></script>
-</head>
+  {SCRAMBLE_SCRIPT}
+</head>'''
+
+
+# Weights the stylesheet above actually uses (300 never appears)
+FONT_OPTIMIZED_URL = "https://fonts.googleapis.com/css?family=Titillium+Web:400,600,400italic&display=swap"
+
+
+def _async_stylesheet(href: str, extra: str = "") -> str:
+    """A stylesheet link that doesn't block first paint (with a no-JS fallback)."""
+    link = f'<link rel="stylesheet" href="{href}"{extra}'
+    return f'''{link} media="print" onload="this.media='all'"><noscript>{link}></noscript>'''
+
+
+def optimize_page(page: str) -> str:
+    """Rewrite a rendered page so nothing in <head> blocks first paint.
+
+    - Icon CSS: the CDN stylesheets (with their SRI hashes) load asynchronously.
+    - Titillium Web: Google Fonts with only the used weights and font-display: swap.
+    - Scripts are deferred; the e-mail unscrambler waits for DOMContentLoaded.
+    """
+    icon_links = "\n".join(
+        "  " + _async_stylesheet(url, f' integrity="{sri}" crossorigin="anonymous"')
+        for url, sri in ICON_STYLESHEETS
+    )
+    font_link = (
+        '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n  '
+        + _async_stylesheet(FONT_OPTIMIZED_URL)
+    )
+
+    page = page.replace(ICON_LINKS, icon_links, 1)
+    page = page.replace(FONT_LINK, font_link, 1)
+    page = page.replace(HIDEBIB_SCRIPT, HIDEBIB_SCRIPT.replace("<script ", "<script defer "), 1)
+    page = page.replace(SCRAMBLE_SCRIPT, SCRAMBLE_SCRIPT.replace("<script ", "<script defer "), 1)
+    page = page.replace(EMAIL_SCRAMBLE, f"document.addEventListener('DOMContentLoaded', function () {{\n    {EMAIL_SCRAMBLE}\n    }});", 1)
+    return page
+
+
+def is_remote(url: str) -> bool:
+    """True for URLs the browser fetches from another host."""
+    return url.startswith(("http://", "https://", "//"))
+
+
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".ogg", ".m4a")
+
+
+def entry_budget(pub_id: str, pub: Dict[str, Any], row_html: str, is_new: bool, root_dir: str, file_sizes: Dict[str, int]) -> Dict[str, Any]:
+    """Page-weight accounting for one rendered publication row.
+
+    Remote requests cover iframes, remote images and remote audio sources.
+    Local bytes cover the images the row loads; local audio is excluded
+    because the players use preload="none". file_sizes memoizes stat calls.
+    """
+    remote = 0
+    local_paths = ["images/new.png"] if is_new else []
+    for url in media_urls(pub):
+        if is_remote(url):
+            remote += 1
+        elif not url.lower().endswith(AUDIO_EXTENSIONS):
+            local_paths.append(url)
+
+    image_bytes = 0
+    for path in local_paths:
+        if path not in file_sizes:
+            full_path = os.path.join(root_dir, path)
+            file_sizes[path] = os.path.getsize(full_path) if os.path.exists(full_path) else 0
+        image_bytes += file_sizes[path]
+
+    return {
+        "id": pub_id,
+        "html_bytes": len(row_html.encode("utf-8")),
+        "remote_requests": remote,
+        "image_bytes": image_bytes,
+    }
+
+
+# Page-level budgets, set under "budgets" in site.json's config
+BUDGETS = [
+    # (config key, description, measure(entries, page_bytes))
+    ("maxPageBytes", "page HTML bytes", lambda entries, page_bytes: page_bytes),
+    ("maxRemoteRequests", "remote media requests", lambda entries, page_bytes: sum(e["remote_requests"] for e in entries)),
+    ("maxImageBytes", "local image bytes", lambda entries, page_bytes: sum(e["image_bytes"] for e in entries)),
+    ("maxEntryBytes", "HTML bytes of the largest entry", lambda entries, page_bytes: max((e["html_bytes"] for e in entries), default=0)),
+]
+
+
+def budget_violations(entries: List[Dict[str, Any]], page_bytes: int, budgets: Dict[str, int]) -> List[str]:
+    """Describe every configured budget the page exceeds."""
+    violations = []
+    for key, description, measure in BUDGETS:
+        if key in budgets:
+            value = measure(entries, page_bytes)
+            if value > budgets[key]:
+                violations.append(f"{description}: {value:,} > {budgets[key]:,} ({key})")
+    return violations
+
+
+def render_budget_report(entries: List[Dict[str, Any]], page_bytes: int) -> str:
+    """Per-entry budget table, heaviest HTML first."""
+    lines = [f"{'ID':<24} {'HTML':>9} {'Remote':>7} {'Images':>11}"]
+    for entry in sorted(entries, key=lambda e: e["html_bytes"], reverse=True):
+        lines.append(f"{entry['id']:<24} {entry['html_bytes']:>9,} {entry['remote_requests']:>7} {entry['image_bytes']:>11,}")
+    lines.append(
+        f"{'Total (' + str(len(entries)) + ' entries)':<24} {sum(e['html_bytes'] for e in entries):>9,} "
+        f"{sum(e['remote_requests'] for e in entries):>7} {sum(e['image_bytes'] for e in entries):>11,}"
+    )
+    lines.append(f"{'Page':<24} {page_bytes:>9,}")
+    return "\n".join(lines)
+
+
+# Bump when a code change alters the generated HTML, so old manifests stop matching
+GENERATOR_VERSION = "2026.10.1"
+MANIFEST_FILE = "build_manifest.json"
+# Code and data the renderer reads besides the --data/--site/--citations files
+GENERATOR_FILES = ["build_site.py", "selection.py", "authors.py", "author_aliases.json", "citation_store.py"]
+
+
+def build_options(data_file: str, site_file: str, output: str, citations_db: Optional[str], index_pages: bool, optimize_head: bool, jsonld: str) -> Dict[str, Any]:
+    """The options that affect the generated files, as recorded in the manifest."""
+    return {
+        "data": data_file,
+        "site": site_file,
+        "output": output,
+        "citations": citations_db,
+        "indexPages": index_pages,
+        "optimizeHead": optimize_head,
+        "jsonld": jsonld,
+    }
+
+
+def input_hashes(options: Dict[str, Any], root_dir: str) -> Dict[str, Optional[str]]:
+    """sha256 of every file a build with these options reads (None if missing).
+
+    Local media files are not listed: only their paths reach the HTML.
+    """
+    paths = [options["data"], options["site"]] + GENERATOR_FILES
+    if options["citations"]:
+        paths.append(options["citations"])
+    return {path: atomic_output.file_hash(os.path.join(root_dir, path)) for path in sorted(set(paths))}
+
+
+def build_manifest(options: Dict[str, Any], inputs: Dict[str, Optional[str]], entry_ids: List[str], outputs: Dict[str, str]) -> Dict[str, Any]:
+    """Everything needed to tell whether a later build would produce the same files."""
+    return {
+        "generatorVersion": GENERATOR_VERSION,
+        "options": options,
+        "inputs": inputs,
+        "entries": entry_ids,
+        "outputs": {
+            path: hashlib.sha256(page.encode("utf-8")).hexdigest()
+            for path, page in sorted(outputs.items())
+        },
+    }
+
+
+def check_manifest(manifest_path: str, options: Dict[str, Any], root_dir: str) -> List[str]:
+    """Reasons the files on disk may differ from a build with these options ([] if up to date).
+
+    Only hashes inputs and outputs; nothing is rendered.
+    """
+    if not os.path.exists(manifest_path):
+        return [f"{os.path.relpath(manifest_path, root_dir)} not found"]
+    manifest = load_json(manifest_path)
+
+    problems = []
+    if manifest.get("generatorVersion") != GENERATOR_VERSION:
+        problems.append(f"generator version {manifest.get('generatorVersion')} != {GENERATOR_VERSION}")
+    for key, value in options.items():
+        if manifest.get("options", {}).get(key) != value:
+            problems.append(f"option {key}: built with {manifest.get('options', {}).get(key)!r}, checking {value!r}")
+    if problems:
+        return problems
+
+    for path, digest in input_hashes(options, root_dir).items():
+        if manifest["inputs"].get(path) != digest:
+            problems.append(f"input changed: {path}")
+    for path, digest in manifest["outputs"].items():
+        actual = atomic_output.file_hash(os.path.join(root_dir, path))
+        if actual is None:
+            problems.append(f"output missing: {path}")
+        elif actual != digest:
+            problems.append(f"output modified: {path}")
+    return problems
+
+
+def build_outputs(data_file: str, site_file: str = "site.json", output: str = "index.html", citations_db: Optional[str] = None, index_pages: bool = False, optimize_head: bool = False, budget: Optional[Dict[str, Any]] = None, jsonld: str = "consolidated", entries: Optional[List[str]] = None) -> Dict[str, str]:
+    """Build the main page and, optionally, the author/venue/year index pages.
+
+    `jsonld` places the schema.org structured data: one block for the whole
+    page ("consolidated"), one block after each row ("inline") or "none".
+    With optimize_head, every page's <head> is rewritten by optimize_page().
+    If a `budget` dict is given, it is filled with the per-entry accounting
+    ("entries"), the main page size ("page_bytes") and the configured "budgets".
+    An `entries` list is filled with the publication IDs the page lists.
+
+    Returns {output path relative to the site root: html}.
+    """
+
+    # Load data
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    data = load_json(os.path.join(script_dir, data_file))
+    site = load_json(os.path.join(script_dir, site_file))
+
+    publications = data.get("publications", {})
+    config = site.get("config", {"ownerName": "Rafael Valle", "highlightColor": "deeppink"})
+    new_badge_ids = site.get("newBadgeIds", [])
+    # Aliases plus the catalog's own spellings, so one person gets one name
+    names = catalog_index(publications)
+
+    # Citation stats come from the store's latest snapshot, not the full history
+    citations = {}
+    citation_summary_html = ""
+    if citations_db:
+        citations_path = os.path.join(script_dir, citations_db)
+        # sqlite3 would silently create an empty store
+        if not os.path.exists(citations_path):
+            raise FileNotFoundError(f"Citation store not found: {citations_db}")
+        store = citation_store.open_store(citations_path)
+        citations = citation_store.latest_counts(store)
+        citation_summary_html = render_citation_summary(citation_store.latest_summary(store))
+        store.close()
+
+    # Render sections
+    news_html = ""
+    publications_html = ""
+    jsonld_html = ""
+    outputs = {}
+
+    for section in site.get("sections", []):
+        if section["type"] == "news":
+            news_html = render_news(section, publications)
+        elif section["type"] == "publications":
+            entry_ids = selection.select_entries(section, publications, citations)
+            if entries is not None:
+                entries.extend(pub_id for pub_id in entry_ids if pub_id in publications)
+            articles = {} if jsonld != "none" else None
+            rows = render_publication_rows(entry_ids, publications, config, new_badge_ids, citations, articles, names)
+            if jsonld == "inline":
+                publications_html = "\n".join(f"{row}\n{jsonld_script(articles[pub_id])}" for pub_id, row in rows.items())
+            else:
+                publications_html = "\n".join(rows.values())
+            if jsonld == "consolidated" and articles:
+                jsonld_html = jsonld_script({"@graph": list(articles.values())})
+            if budget is not None:
+                file_sizes = {}
+                budget["entries"] = [
+                    entry_budget(pub_id, publications[pub_id], row, pub_id in new_badge_ids, script_dir, file_sizes)
+                    for pub_id, row in rows.items()
+                ]
+            if index_pages:
+                indexes = build_indexes(entry_ids, publications, names)
+                outputs.update(render_index_pages(indexes, rows, config.get("ownerName", "Rafael Valle"), output, articles))
+
+    # Build full HTML
+    html_template = f'''<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN">
+<html>
+
+{render_head(config.get("ownerName", "Rafael Valle"))}
 
 <body>
 <table width="840" border="0" align="center" border="0" cellspacing="0" cellpadding="20">
@@ -287,9 +775,7 @@ def build_html(data_file: str, site_file: str = "site.json") -> str:
       <noscript><i>Please enable Javascript to view</i></noscript>
     </font>
     <script>
-    emailScramble = new scrambledString(document.getElementById('email'),
-        'emailScramble', 'lfbkae@araeeeyvlled.lure',
-        [5, 2, 12, 15, 7, 13, 11, 3, 14, 1, 4, 10, 16, 19, 6, 8, 17, 21, 22, 20, 9, 23, 0, 18]);
+    {EMAIL_SCRAMBLE}
     </script>
   </p>
 
@@ -376,24 +862,12 @@ segments and scores that describe novelty seeking behavior in listeners.
 
 <!-- Publications Section -->
 <table width="100%" align="center" border="0" cellspacing="0" cellpadding="20">
-  <tr><td><sectionheading>Publications</sectionheading></td></tr>
+  <tr><td><sectionheading>Publications</sectionheading>{citation_summary_html}</td></tr>
 </table>
 <table width="100%" align="center" border="0" cellspacing="0" cellpadding="20">
 {publications_html}
 </table>
-
-<!-- Initialize hidebib -->
-<script>
-if (typeof hideallbibs === 'function') {{
-  hideallbibs();
-}}
-document.querySelectorAll('[id$="_abs"]').forEach(el => {{
-  if (typeof hideblock === 'function') {{
-    hideblock(el.id);
-  }}
-}});
-</script>
-
+{jsonld_html}
 </td></tr>
 </table>
 </body>
@@ -401,7 +875,54 @@ document.querySelectorAll('[id$="_abs"]').forEach(el => {{
 </html>
 '''
 
-    return html_template
+    outputs[output] = html_template
+    if optimize_head:
+        outputs = {path: optimize_page(page) for path, page in outputs.items()}
+    if budget is not None:
+        budget.setdefault("entries", [])
+        budget["page_bytes"] = len(outputs[output].encode("utf-8"))
+        budget["budgets"] = config.get("budgets", {})
+    return outputs
+
+
+def build_html(data_file: str, site_file: str = "site.json", citations_db: Optional[str] = None) -> str:
+    """Build the complete HTML page."""
+    return build_outputs(data_file, site_file, "index.html", citations_db)["index.html"]
+
+
+def build_and_write(args: argparse.Namespace, options: Dict[str, Any], manifest_path: str, script_dir: str) -> Tuple[Dict[str, str], int]:
+    """Build the pages, write them and the manifest; exit if a budget is exceeded.
+
+    Callers hold the build lock, so no other build or fetch writes the
+    inputs while they are read. Inputs are hashed before they are read:
+    if one is edited mid-build anyway, the manifest keeps the old hash and
+    --check reports the output as stale.
+    Returns (outputs, number of files left unchanged).
+    """
+    inputs = input_hashes(options, script_dir)
+    budget = {}
+    entry_ids = []
+    outputs = build_outputs(args.data, args.site, args.output, args.citations, args.index_pages, args.optimize_head, budget, args.jsonld, entry_ids)
+
+    if args.budget_report:
+        print("\nBudget report:")
+        print(render_budget_report(budget["entries"], budget["page_bytes"]))
+
+    violations = budget_violations(budget["entries"], budget["page_bytes"], budget["budgets"])
+    if violations:
+        print("\nError: page budget exceeded, nothing written:")
+        for violation in violations:
+            print(f"  - {violation}")
+        sys.exit(1)
+
+    unchanged = 0
+    for relative_path, html_content in outputs.items():
+        output_path = os.path.join(script_dir, relative_path)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        if not atomic_output.write_text(output_path, html_content):
+            unchanged += 1
+    atomic_output.write_json(manifest_path, build_manifest(options, inputs, entry_ids, outputs))
+    return outputs, unchanged
 
 
 def main():
@@ -413,6 +934,11 @@ Examples:
     python build_site.py --data data.json
     python build_site.py --data data_prefetched.json
     python build_site.py --data data.json --output index.html
+    python build_site.py --data data.json --citations citations.db
+    python build_site.py --data data.json --index-pages
+    python build_site.py --data data.json --optimize-head
+    python build_site.py --data data.json --budget-report
+    python build_site.py --data data.json --check
         """
     )
     parser.add_argument(
@@ -430,23 +956,86 @@ Examples:
         default="index.html",
         help="Output HTML file (default: index.html)"
     )
+    parser.add_argument(
+        "--optimize-head",
+        action="store_true",
+        help="Load the icon CSS and fonts without blocking first paint and defer scripts"
+    )
+    parser.add_argument(
+        "--index-pages",
+        action="store_true",
+        help=f"Also generate per-author, per-venue and per-year pages in {INDEX_DIR}/"
+    )
+    parser.add_argument(
+        "--budget-report",
+        action="store_true",
+        help="Print HTML bytes, remote requests and local image bytes for each entry"
+    )
+    parser.add_argument(
+        "--citations",
+        metavar="DB",
+        help="Show citation counts from this store (e.g. citations.db, written by fetch_scholar.py)"
+    )
+    parser.add_argument(
+        "--jsonld",
+        choices=JSONLD_MODES,
+        default="consolidated",
+        help="schema.org ScholarlyArticle data: one block per page, one per entry, or none (default: consolidated)"
+    )
+    parser.add_argument(
+        "--lock-timeout",
+        type=float,
+        default=atomic_output.LOCK_TIMEOUT,
+        help=f"Seconds to wait for another build writing the same files (default: {atomic_output.LOCK_TIMEOUT:g})"
+    )
+    parser.add_argument(
+        "--manifest",
+        default=MANIFEST_FILE,
+        help=f"Build manifest with input and output hashes (default: {MANIFEST_FILE})"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Verify the existing build against the current inputs and the manifest without rebuilding"
+    )
 
     args = parser.parse_args()
 
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    options = build_options(args.data, args.site, args.output, args.citations, args.index_pages, args.optimize_head, args.jsonld)
+    manifest_path = os.path.join(script_dir, args.manifest)
+
+    if args.check:
+        problems = check_manifest(manifest_path, options, script_dir)
+        if problems:
+            print("Build is out of date:")
+            for problem in problems:
+                print(f"  - {problem}")
+            sys.exit(1)
+        print(f"Build is up to date ({args.manifest})")
+        return
+
+    if args.citations and not os.path.exists(os.path.join(script_dir, args.citations)):
+        print(f"Error: citation store not found: {args.citations} (run fetch_scholar.py to create it)")
+        sys.exit(1)
+
     print(f"Building site...")
     print(f"  Data file: {args.data}")
     print(f"  Site file: {args.site}")
     print(f"  Output: {args.output}")
 
-    html_content = build_html(args.data, args.site)
-
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    output_path = os.path.join(script_dir, args.output)
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    try:
+        with atomic_output.build_lock(script_dir, args.lock_timeout):
+            outputs, unchanged = build_and_write(args, options, manifest_path, script_dir)
+    except atomic_output.LockTimeout as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
 
     print(f"\nDone! Generated {args.output}")
+    if unchanged:
+        print(f"  - {unchanged} of {len(outputs)} files unchanged (left untouched)")
+    if args.index_pages:
+        print(f"  - {len(outputs) - 1} index pages in {INDEX_DIR}/")
     print(f"  - SEO-friendly static HTML with pre-rendered publications")
     print(f"  - All content is now crawlable by search engines")
 
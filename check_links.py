@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Check that every link and media URL in a data file still resolves.
+
+Usage:
+    python check_links.py --data data.json
+    python check_links.py --data data_prefetched.json --ttl-hours 0
+
+This script:
+1. Collects every URL emitted for each publication (links and media sources)
+2. Verifies local paths (e.g. images/...) against the filesystem
+3. Sends HEAD requests for remote URLs concurrently, reusing keep-alive
+   connections and limiting how many requests hit the same host at once
+4. Caches working links in .link_cache.json so repeat runs only re-probe stale
+   URLs; broken links and timeouts are never cached, so they are re-checked
+   on every run
+
+Exits with status 1 if any link is broken.
+"""
+
+import argparse
+import asyncio
+import html
+import http.client
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import atomic_output
+import json_stream
+from build_site import publication_urls
+
+
+CACHE_FILE = ".link_cache.json"
+USER_AGENT = "Mozilla/5.0 (compatible; rafaelvalle.github.io link checker)"
+MAX_REDIRECTS = 5
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, pooled per (scheme, host)."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme: str, netloc: str, fresh: bool = False) -> http.client.HTTPConnection:
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get((scheme, netloc))
+                if idle:
+                    return idle.pop()
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault((scheme, netloc), []).append(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+def request_status(pool: ConnectionPool, url: str) -> Tuple[int, str]:
+    """Return (status, final_url) for a URL, following redirects.
+
+    Falls back to GET when the server rejects HEAD.
+    """
+    method = "HEAD"
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        response = None
+        for fresh in (False, True):
+            conn = pool.acquire(parts.scheme, parts.netloc, fresh=fresh)
+            try:
+                conn.request(method, path, headers={"User-Agent": USER_AGENT})
+                response = conn.getresponse()
+                break
+            except (OSError, http.client.HTTPException):
+                # A pooled connection may have been closed by the server; retry once on a new one
+                conn.close()
+                if fresh:
+                    raise
+
+        try:
+            if method == "HEAD":
+                response.read()
+                reusable = not response.will_close
+            else:
+                # Don't download the body of a GET fallback, just drop the connection
+                reusable = False
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+
+        if reusable:
+            pool.release(parts.scheme, parts.netloc, conn)
+        else:
+            conn.close()
+
+        status = response.status
+        if status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+            url = urljoin(url, response.getheader("Location"))
+            continue
+        if method == "HEAD" and status in (403, 405, 501):
+            method = "GET"
+            continue
+        return status, url
+
+    return 310, url  # Too many redirects
+
+
+def load_cache(cache_path: str) -> Dict[str, Any]:
+    """Load the link-check cache if it exists."""
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_cache(cache_path: str, cache: Dict[str, Any]) -> None:
+    """Write the link-check cache."""
+    atomic_output.write_json(cache_path, cache, sort_keys=True, ensure_ascii=True)
+
+
+def collect_urls(publications: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, List[str]]:
+    """Map each URL to the publication IDs that reference it."""
+    urls: Dict[str, List[str]] = {}
+    for pub_id, pub in publications:
+        for url in publication_urls(pub):
+            # Some embed URLs are stored HTML-escaped in the data files
+            urls.setdefault(html.unescape(url), []).append(pub_id)
+    return urls
+
+
+def check_local(url: str, base_dir: str) -> Dict[str, Any]:
+    """Check a site-relative path against the filesystem."""
+    path = os.path.join(base_dir, urlsplit(url).path)
+    ok = os.path.isfile(path)
+    return {"ok": ok, "status": 200 if ok else 404, "checked": time.time()}
+
+
+async def check_remote(urls: List[str], concurrency: int, per_host: int, timeout: float) -> Dict[str, Dict[str, Any]]:
+    """Check remote URLs concurrently with a global and a per-host limit."""
+    pool = ConnectionPool(timeout)
+    overall = asyncio.Semaphore(concurrency)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+    results: Dict[str, Dict[str, Any]] = {}
+
+    async def check(url: str) -> None:
+        host = urlsplit(url).netloc.lower()
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host))
+        async with host_limit, overall:
+            try:
+                status, final_url = await asyncio.to_thread(request_status, pool, url)
+                result = {"ok": 200 <= status < 400, "status": status}
+                if final_url != url:
+                    result["final_url"] = final_url
+            except (OSError, http.client.HTTPException) as e:
+                result = {"ok": False, "status": None, "error": str(e) or type(e).__name__}
+        result["checked"] = time.time()
+        results[url] = result
+
+    try:
+        await asyncio.gather(*(check(url) for url in urls))
+    finally:
+        pool.close()
+    return results
+
+
+def check_links(
+    publications: Iterable[Tuple[str, Dict[str, Any]]],
+    base_dir: str,
+    cache: Dict[str, Any],
+    ttl: float,
+    concurrency: int = 16,
+    per_host: int = 4,
+    timeout: float = 10.0,
+) -> Dict[str, Dict[str, Any]]:
+    """Check all URLs in (id, publication) pairs, reusing fresh cached results.
+
+    Returns a mapping of URL -> result. `cache` is updated in place, with
+    successes only: a failure may be transient, so it is always re-checked.
+    """
+    urls = collect_urls(publications)
+    now = time.time()
+    stale = []
+    results = {}
+
+    for url in urls:
+        if not urlsplit(url).scheme:
+            results[url] = check_local(url, base_dir)
+            continue
+        cached = cache.get(url)
+        if cached and cached.get("ok") and now - cached.get("checked", 0) < ttl:
+            results[url] = cached
+        else:
+            stale.append(url)
+
+    print(f"Checking {len(stale)} remote URLs ({len(urls) - len(stale)} local or cached)")
+    fresh = asyncio.run(check_remote(stale, concurrency, per_host, timeout)) if stale else {}
+    for url, result in fresh.items():
+        if result["ok"]:
+            cache[url] = result
+        else:
+            cache.pop(url, None)
+    results.update(fresh)
+
+    return {url: dict(result, ids=urls[url]) for url, result in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check links and media URLs in a publication data file.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python check_links.py --data data.json
+    python check_links.py --data data_prefetched.json --ttl-hours 0
+        """
+    )
+    parser.add_argument(
+        "--data",
+        default="data.json",
+        help="JSON file containing publication data (default: data.json)"
+    )
+    parser.add_argument(
+        "--cache",
+        default=CACHE_FILE,
+        help=f"Result cache file (default: {CACHE_FILE})"
+    )
+    parser.add_argument(
+        "--ttl-hours",
+        type=float,
+        default=24 * 7,
+        help="Re-check cached results older than this (default: 168)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Maximum requests in flight (default: 16)"
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=4,
+        help="Maximum requests in flight per host (default: 4)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=10.0,
+        help="Per-request timeout in seconds (default: 10)"
+    )
+
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    publications = json_stream.iter_publications(os.path.join(script_dir, args.data))
+    cache_path = os.path.join(script_dir, args.cache)
+    cache = load_cache(cache_path)
+
+    results = check_links(
+        publications,
+        script_dir,
+        cache,
+        ttl=args.ttl_hours * 3600,
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        timeout=args.timeout,
+    )
+    save_cache(cache_path, cache)
+
+    broken = {url: r for url, r in results.items() if not r["ok"]}
+    print(f"\n{len(results) - len(broken)} OK, {len(broken)} broken")
+    for url, result in sorted(broken.items()):
+        reason = result.get("error") or result.get("status")
+        print(f"  - [{', '.join(result['ids'])}] {url} ({reason})")
+
+    if broken:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Citation-count history for every publication, stored in SQLite.
+
+Usage:
+    python citation_store.py
+    python citation_store.py --db citations.db --movers 20
+
+fetch_scholar.py appends one snapshot per run. Only counts that changed since
+the previous snapshot are stored, and a `latest` table plus per-fetch
+aggregates (total, h-index) are maintained on append, so build_site.py can
+render current stats without reading the history.
+"""
+
+import argparse
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+
+DB_FILE = "citations.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetches (
+    fetch_id INTEGER PRIMARY KEY,
+    fetched_at TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    h_index INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counts (
+    pub_id TEXT NOT NULL,
+    fetch_id INTEGER NOT NULL REFERENCES fetches(fetch_id),
+    count INTEGER NOT NULL,
+    PRIMARY KEY (pub_id, fetch_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS latest (
+    pub_id TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    year INTEGER
+) WITHOUT ROWID;
+"""
+
+
+def default_db_path() -> str:
+    """citations.db next to data.json."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), DB_FILE)
+
+
+def open_store(path: Optional[str] = None) -> sqlite3.Connection:
+    """Open (creating if needed) the citation store."""
+    conn = sqlite3.connect(path or default_db_path())
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def h_index(counts: List[int]) -> int:
+    """Largest h such that h publications have at least h citations."""
+    h = 0
+    for i, count in enumerate(sorted(counts, reverse=True), start=1):
+        if count < i:
+            break
+        h = i
+    return h
+
+
+def record_fetch(
+    conn: sqlite3.Connection,
+    counts: Dict[str, Tuple[int, Optional[int]]],
+    fetched_at: Optional[str] = None,
+) -> int:
+    """Append a snapshot of {pub_id: (citations, year)} and return its fetch id.
+
+    Publications missing from `counts` keep their previous count.
+    """
+    fetched_at = fetched_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+    previous = dict(conn.execute("SELECT pub_id, count FROM latest"))
+
+    current = dict(previous)
+    current.update({pub_id: count for pub_id, (count, _) in counts.items()})
+
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO fetches (fetched_at, total, h_index) VALUES (?, ?, ?)",
+            (fetched_at, sum(current.values()), h_index(list(current.values()))),
+        )
+        fetch_id = cursor.lastrowid
+        changed = [(pub_id, fetch_id, count) for pub_id, (count, _) in counts.items() if previous.get(pub_id) != count]
+        conn.executemany("INSERT INTO counts (pub_id, fetch_id, count) VALUES (?, ?, ?)", changed)
+        conn.executemany(
+            "INSERT INTO latest (pub_id, count, year) VALUES (?, ?, ?) "
+            "ON CONFLICT(pub_id) DO UPDATE SET count = excluded.count, year = COALESCE(excluded.year, latest.year)",
+            [(pub_id, count, year) for pub_id, (count, year) in counts.items()],
+        )
+    return fetch_id
+
+
+def latest_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Current citation count per publication."""
+    return dict(conn.execute("SELECT pub_id, count FROM latest"))
+
+
+def latest_summary(conn: sqlite3.Connection) -> Optional[Dict[str, object]]:
+    """Total citations and h-index from the most recent fetch."""
+    row = conn.execute(
+        "SELECT fetched_at, total, h_index FROM fetches ORDER BY fetch_id DESC LIMIT 1"
+    ).fetchone()
+    if row is None:
+        return None
+    return {"fetched_at": row[0], "total": row[1], "h_index": row[2]}
+
+
+def h_index_history(conn: sqlite3.Connection) -> List[Tuple[str, int, int]]:
+    """(fetched_at, total, h_index) for every fetch, oldest first."""
+    return conn.execute("SELECT fetched_at, total, h_index FROM fetches ORDER BY fetch_id").fetchall()
+
+
+def citation_series(conn: sqlite3.Connection, pub_id: str) -> List[Tuple[str, int]]:
+    """(fetched_at, count) for each change in a publication's count."""
+    return conn.execute(
+        "SELECT f.fetched_at, c.count FROM counts c JOIN fetches f USING (fetch_id) "
+        "WHERE c.pub_id = ? ORDER BY c.fetch_id",
+        (pub_id,),
+    ).fetchall()
+
+
+def top_movers(conn: sqlite3.Connection, days: int = 365, limit: int = 10) -> List[Tuple[str, int, int]]:
+    """Publications that gained the most citations in the last `days`.
+
+    Gains are measured from the first recorded count when the history is
+    shorter than the window. Returns (pub_id, gain, current_count), largest gain first.
+    """
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat(timespec="seconds")
+    return conn.execute(
+        """
+        SELECT l.pub_id, l.count - COALESCE((
+                   SELECT c.count FROM counts c JOIN fetches f USING (fetch_id)
+                   WHERE c.pub_id = l.pub_id AND f.fetched_at <= ?
+                   ORDER BY c.fetch_id DESC LIMIT 1
+               ), (
+                   SELECT c.count FROM counts c WHERE c.pub_id = l.pub_id
+                   ORDER BY c.fetch_id LIMIT 1
+               )) AS gain, l.count
+        FROM latest l
+        ORDER BY gain DESC, l.count DESC
+        LIMIT ?
+        """,
+        (since, limit),
+    ).fetchall()
+
+
+def totals_by_year(conn: sqlite3.Connection) -> List[Tuple[Optional[int], int, int]]:
+    """(publication year, publications, current citations), newest first."""
+    return conn.execute(
+        "SELECT year, COUNT(*), SUM(count) FROM latest GROUP BY year ORDER BY year IS NULL, year DESC"
+    ).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show citation statistics recorded by fetch_scholar.py.")
+    parser.add_argument(
+        "--db",
+        default=default_db_path(),
+        help=f"Citation store (default: {DB_FILE})"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=365,
+        help="Window for top movers, in days (default: 365)"
+    )
+    parser.add_argument(
+        "--movers",
+        type=int,
+        default=10,
+        help="Number of top movers to show (default: 10)"
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"No citation history yet ({args.db}); run fetch_scholar.py first.")
+        return
+
+    conn = open_store(args.db)
+
+    print("Citations and h-index over time:")
+    for fetched_at, total, h in h_index_history(conn):
+        print(f"  {fetched_at}  total={total:<6} h-index={h}")
+
+    print(f"\nTop movers (last {args.days} days):")
+    for pub_id, gain, count in top_movers(conn, args.days, args.movers):
+        print(f"  {pub_id:<24} +{gain:<5} ({count} total)")
+
+    print("\nBy publication year:")
+    for year, pubs, total in totals_by_year(conn):
+        print(f"  {year or 'n/a':<6} {pubs:>3} publications  {total:>6} citations")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,30 +10,49 @@ This script:
 1. Loads ALL existing entries from data.json (your hand-curated data)
 2. Fetches publications from Google Scholar
 3. Adds ONLY NEW publications (those not already in data.json, matched by title)
-4. Outputs everything to data_prefetched.json
+4. Fills missing abstracts/authors/bibtex of new entries from arXiv metadata
+5. Outputs everything to data_prefetched.json
 
 Your data.json entries are NEVER overwritten - they take priority.
 New Scholar entries use placeholder fields (media, bibtex, etc.).
 """
 
+import argparse
 import json
 import os
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import urllib.parse
+import urllib.request
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import atomic_output
+import citation_store
+import json_stream
+import scholar_replay
+import selection
+from authors import default_index as author_index
 
 try:
     from scholarly import scholarly
 except ImportError:
-    print("Error: 'scholarly' library not installed.")
-    print("Install it with: pip install scholarly")
-    exit(1)
+    scholarly = None  # Checked in main(), so the helpers stay importable
 
 
 # Configuration
 SCHOLAR_ID = "SktxU8IAAAAJ"  # Rafael Valle's Google Scholar ID
 OUTPUT_FILE = "data_prefetched.json"
 DATA_FILE = "data.json"  # Existing curated data file
+REGISTRY_FILE = "id_registry.json"  # Title fingerprint -> ID, kept next to data.json
+JOURNAL_FILE = ".fetch_journal.jsonl"  # Checkpoint of filled publications, removed after a clean run
+BLOCK_THRESHOLD = 5  # Consecutive failed requests before assuming Scholar blocked us
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ARXIV_CACHE_FILE = ".arxiv_cache.json"
+ARXIV_BATCH_SIZE = 50  # ids per arXiv API request
+ARXIV_MISS_TTL = 24 * 3600  # seconds before an id arXiv had nothing for is asked again
 
 
 def generate_id(title: str) -> str:
@@ -79,34 +98,165 @@ def generate_id(title: str) -> str:
 
 
 def parse_authors(author_string: str) -> List[str]:
-    """Parse author string into a list of author names."""
-    if not author_string:
-        return []
-
-    # Split by comma or "and"
-    authors = re.split(r",\s*|\s+and\s+", author_string)
-    return [a.strip() for a in authors if a.strip()]
+    """Parse author string into a list of canonical author names (see authors.py)."""
+    return author_index().parse(author_string)
 
 
 def extract_arxiv_id(url: str) -> Optional[str]:
     """Extract arXiv ID from a URL if present."""
     if not url:
         return None
-    match = re.search(r"arxiv\.org/abs/(\d+\.\d+)", url)
+    match = re.search(r"arxiv\.org/(?:abs|pdf)/(\d+\.\d+)", url)
     if match:
         return match.group(1)
     return None
 
 
+def http_get(url: str) -> bytes:
+    """Default transport for metadata lookups."""
+    request = urllib.request.Request(url, headers={"User-Agent": "rafaelvalle.github.io fetcher"})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def parse_arxiv_feed(feed: bytes) -> Dict[str, Dict[str, Any]]:
+    """Parse an arXiv API Atom feed into {arxiv_id: metadata}."""
+    ns = {"atom": "http://www.w3.org/2005/Atom"}
+    results = {}
+    for entry in ET.fromstring(feed).findall("atom:entry", ns):
+        arxiv_id = extract_arxiv_id(entry.findtext("atom:id", "", ns))
+        if not arxiv_id:
+            continue  # Error entries for unknown ids have no abs/ URL
+
+        def text(tag: str) -> str:
+            return " ".join(entry.findtext(tag, "", ns).split())
+
+        results[arxiv_id] = {
+            "title": text("atom:title"),
+            "authors": [" ".join(a.findtext("atom:name", "", ns).split()) for a in entry.findall("atom:author", ns)],
+            "abstract": text("atom:summary"),
+            "year": int(text("atom:published")[:4]) if text("atom:published") else None,
+        }
+    return results
+
+
+def fetch_arxiv_metadata(
+    arxiv_ids: List[str],
+    cache_path: str = ARXIV_CACHE_FILE,
+    api_url: str = ARXIV_API_URL,
+    transport: Callable[[str], bytes] = http_get,
+    batch_size: int = ARXIV_BATCH_SIZE,
+    miss_ttl: float = ARXIV_MISS_TTL,
+) -> Dict[str, Dict[str, Any]]:
+    """Look up arXiv metadata for many ids, batching requests and caching on disk.
+
+    Only ids missing from the cache are requested, `batch_size` per call.
+    Ids that arXiv returned nothing for, or whose request failed, are cached
+    as {"missing": True, "checked": timestamp} and asked again once that
+    entry is older than `miss_ttl` seconds.
+    """
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+
+    now = time.time()
+    missing = sorted(
+        arxiv_id for arxiv_id in set(arxiv_ids)
+        if arxiv_id not in cache
+        or (cache[arxiv_id].get("missing") and now - cache[arxiv_id].get("checked", 0) >= miss_ttl)
+    )
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start:start + batch_size]
+        query = urllib.parse.urlencode({"id_list": ",".join(batch), "max_results": len(batch)})
+        print(f"  Querying arXiv for {len(batch)} ids...")
+        try:
+            found = parse_arxiv_feed(transport(f"{api_url}?{query}"))
+        except Exception as e:
+            print(f"    Warning: arXiv lookup failed: {e}")
+            found = {}
+        checked = time.time()
+        for arxiv_id in batch:
+            cache[arxiv_id] = found.get(arxiv_id) or {"missing": True, "checked": checked}
+        if start + batch_size < len(missing):
+            time.sleep(3)  # arXiv asks for 3 seconds between API calls
+
+    if missing:
+        atomic_output.write_json(cache_path, cache, sort_keys=True)
+
+    return {
+        arxiv_id: cache[arxiv_id] for arxiv_id in arxiv_ids
+        if arxiv_id in cache and not cache[arxiv_id].get("missing")
+    }
+
+
+def arxiv_bibtex(arxiv_id: str, meta: Dict[str, Any]) -> str:
+    """Build a Scholar-style @article entry from arXiv metadata."""
+    authors = meta.get("authors", [])
+    year = meta.get("year") or ""
+    last_name = authors[0].split()[-1].lower() if authors else "anon"
+    first_word = re.sub(r"[^a-z0-9]", "", meta.get("title", "").split()[0].lower()) if meta.get("title") else ""
+    bib_authors = " and ".join(
+        f"{a.split()[-1]}, {' '.join(a.split()[:-1])}" if len(a.split()) > 1 else a for a in authors
+    )
+    return (
+        f"@article{{{last_name}{year}{first_word},\n"
+        f"  title={{{meta.get('title', '')}}},\n"
+        f"  author={{{bib_authors}}},\n"
+        f"  journal={{arXiv preprint arXiv:{arxiv_id}}},\n"
+        f"  year={{{year}}}\n"
+        f"}}"
+    )
+
+
+def enrich_with_arxiv(publications: Dict[str, Any], **lookup_options) -> List[str]:
+    """Fill missing abstract/authors/bibtex from arXiv, in place.
+
+    Non-empty fields are never overwritten; author lists are only replaced
+    when Scholar truncated them ("...").
+    Returns the IDs of publications that were changed.
+    """
+    arxiv_ids = {}
+    for pub_id, pub in publications.items():
+        arxiv_id = extract_arxiv_id(pub.get("links", {}).get("arxiv", ""))
+        if arxiv_id:
+            arxiv_ids[pub_id] = arxiv_id
+
+    if not arxiv_ids:
+        return []
+
+    metadata = fetch_arxiv_metadata(list(arxiv_ids.values()), **lookup_options)
+
+    enriched = []
+    for pub_id, arxiv_id in arxiv_ids.items():
+        meta = metadata.get(arxiv_id)
+        if not meta:
+            continue
+        pub = publications[pub_id]
+        changed = False
+        authors = pub.get("authors", [])
+        if meta["authors"] and (not authors or any(a.endswith("...") or a == "\u2026" for a in authors)):
+            pub["authors"] = [author_index().canonicalize(name) for name in meta["authors"]]
+            changed = True
+        if meta["abstract"] and not pub.get("abstract"):
+            pub["abstract"] = meta["abstract"]
+            changed = True
+        if not pub.get("bibtex"):
+            pub["bibtex"] = arxiv_bibtex(arxiv_id, meta)
+            changed = True
+        if changed:
+            enriched.append(pub_id)
+
+    return enriched
+
+
 def load_existing_data() -> Dict[str, Any]:
     """Load existing publications from data.json if it exists."""
     script_dir = os.path.dirname(os.path.abspath(__file__))
     data_path = os.path.join(script_dir, DATA_FILE)
 
     if os.path.exists(data_path):
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("publications", {})
+        return dict(json_stream.iter_publications(data_path))
     return {}
 
 
@@ -141,110 +291,396 @@ def find_matching_entry(title: str, existing_data: Dict[str, Any]) -> Optional[s
     return None
 
 
-def fetch_publications(existing_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Fetch all publications from Google Scholar profile.
+def load_id_registry() -> Dict[str, str]:
+    """Load the title fingerprint -> ID registry if it exists."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    registry_path = os.path.join(script_dir, REGISTRY_FILE)
+
+    if os.path.exists(registry_path):
+        with open(registry_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_id_registry(registry: Dict[str, str]) -> None:
+    """Write the ID registry next to data.json, sorted for stable diffs."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    registry_path = os.path.join(script_dir, REGISTRY_FILE)
+
+    atomic_output.write_json(registry_path, registry, sort_keys=True)
+
+
+def build_id_registry(*catalogs: Dict[str, Any]) -> Dict[str, str]:
+    """Build a registry from existing publication catalogs.
+
+    Earlier catalogs take precedence, so pass data.json first.
+    """
+    registry = {}
+    for catalog in reversed(catalogs):
+        for pub_id, pub in catalog.items():
+            if pub.get("title"):
+                registry[normalize_title(pub["title"])] = pub_id
+    return registry
+
+
+def used_ids(registry: Dict[str, str], taken: Dict[str, Any]) -> Set[str]:
+    """IDs a new publication must not get: registered ones and those in `taken`.
+
+    Build this once per fetch and pass it to every assign_id call, which
+    keeps it up to date.
+    """
+    return set(registry.values()) | set(taken)
+
+
+def assign_id(registry: Dict[str, str], title: str, year: Optional[int], used: Set[str]) -> str:
+    """Return the registered ID for a title, allocating a new one if needed.
+
+    New IDs try generate_id(title), then with the year appended, then a
+    counter, skipping IDs in `used` (see used_ids). Registry and `used` are
+    both updated in place.
+    """
+    fingerprint = normalize_title(title)
+    if fingerprint in registry:
+        return registry[fingerprint]
+
+    base_id = generate_id(title)
+    pub_id = base_id
+    if pub_id in used:
+        pub_id = f"{base_id}{year or ''}"
+
+    counter = 2
+    original_id = pub_id
+    while pub_id in used:
+        pub_id = f"{original_id}_{counter}"
+        counter += 1
+
+    registry[fingerprint] = pub_id
+    used.add(pub_id)
+    return pub_id
+
+
+class RateLimiter:
+    """Space out calls to Google Scholar, shared by all worker threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_call = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def fetch_profile(author_id: str, limiter: RateLimiter, client: Any) -> Dict[str, Any]:
+    """Fetch one author's profile with its (unfilled) publication list.
+
+    `client` is `scholarly` or a stand-in with the same search_author_id/fill
+    methods (see scholar_replay.py).
+    """
+    limiter.wait()
+    author = client.search_author_id(author_id)
+    limiter.wait()
+    return client.fill(author, sections=["publications"])
+
+
+def fill_publication(pub: Dict[str, Any], limiter: RateLimiter, client: Any) -> Optional[Dict[str, Any]]:
+    """Fetch full publication details (includes abstract, etc.), or None on failure."""
+    limiter.wait()
+    try:
+        return client.fill(pub)
+    except Exception as e:
+        print(f"    Warning: Could not fetch details for '{pub['bib'].get('title', 'Unknown')[:50]}': {e}")
+        return None
+
+
+class FetchJournal:
+    """Append-only record of filled publications, so an interrupted fetch can resume.
+
+    Each line is {"fingerprint", "ok", "entry"}; the last line for a
+    fingerprint wins. Failed fills are journaled with the unfilled entry so
+    later passes know to retry them.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn last line from a crash
+                    self.records[record["fingerprint"]] = record
+
+    def done(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """The journaled entry for a fingerprint, if it was filled successfully."""
+        record = self.records.get(fingerprint)
+        return record["entry"] if record and record["ok"] else None
+
+    def record(self, fingerprint: str, entry: Dict[str, Any], ok: bool) -> None:
+        record = {"fingerprint": fingerprint, "ok": ok, "entry": entry}
+        with self._lock:
+            self.records[fingerprint] = record
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class ScholarBlocked(Exception):
+    """Raised when Scholar keeps failing requests, so the run should stop and resume later."""
+
+
+class ProfileFetchError(Exception):
+    """Raised when an author profile could not be fetched, so its papers would be missing."""
+
+
+def fill_with_checkpoints(
+    listings: Dict[str, Dict[str, Any]],
+    journal: FetchJournal,
+    limiter: RateLimiter,
+    workers: int,
+    retries: int = 2,
+    client: Any = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Fill publications, journaling each one, and retry failures with backoff.
+
+    Args:
+        listings: Title fingerprint -> unfilled Scholar publication.
+        client: `scholarly` (the default) or a stand-in, see fetch_profile.
+
+    Returns fingerprint -> entry. Entries that still failed after all retries
+    are built from the unfilled listing (and stay marked failed in the journal).
+    Raises ScholarBlocked after BLOCK_THRESHOLD consecutive failures.
+    """
+    client = client or scholarly
+    entries = {}
+    pending = []
+    for fingerprint in listings:
+        entry = journal.done(fingerprint)
+        if entry is not None:
+            entries[fingerprint] = entry
+        else:
+            pending.append(fingerprint)
+
+    if entries:
+        print(f"Resuming: {len(entries)} publications already fetched in {journal.path}")
+
+    consecutive_failures = 0
+    failures_lock = threading.Lock()
+    blocked = threading.Event()
+
+    def fill(fingerprint: str) -> None:
+        nonlocal consecutive_failures
+        if blocked.is_set():
+            return
+        pub_filled = fill_publication(listings[fingerprint], limiter, client)
+        ok = pub_filled is not None
+        entry = build_entry(pub_filled if ok else listings[fingerprint])
+        journal.record(fingerprint, entry, ok)
+        entries[fingerprint] = entry
+        with failures_lock:
+            consecutive_failures = 0 if ok else consecutive_failures + 1
+            if consecutive_failures >= BLOCK_THRESHOLD:
+                blocked.set()
+
+    for attempt in range(retries + 1):
+        if attempt:
+            backoff = limiter.interval * (4 ** attempt)
+            print(f"Retrying {len(pending)} failed publications in {backoff:.0f}s (pass {attempt + 1})...")
+            time.sleep(backoff)
+            consecutive_failures = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fill, pending))
+
+        if blocked.is_set():
+            raise ScholarBlocked(f"{BLOCK_THRESHOLD} consecutive requests failed")
+
+        pending = [fp for fp in pending if journal.done(fp) is None]
+        if not pending:
+            break
+
+    return entries
+
+
+def build_entry(pub_filled: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a data.json-style entry from a filled Scholar publication."""
+    bib = pub_filled.get("bib", {})
+
+    # Extract authors
+    authors = parse_authors(bib.get("author", ""))
+
+    # Build links
+    links = {}
+    pub_url = pub_filled.get("pub_url", "")
+    if pub_url:
+        if "arxiv.org" in pub_url:
+            links["arxiv"] = pub_url
+        else:
+            links["paper"] = pub_url
+
+    # Check for arXiv in eprint field
+    eprint = bib.get("eprint", "")
+    if eprint and "arxiv" not in links:
+        links["arxiv"] = f"https://arxiv.org/abs/{eprint}"
+
+    return {
+        "title": bib.get("title", "Unknown Title"),
+        "authors": authors,
+        "venue": bib.get("venue", bib.get("journal", bib.get("booktitle", ""))),
+        "year": int(bib.get("pub_year")) if bib.get("pub_year") and str(bib.get("pub_year")).isdigit() else None,
+        "links": links,
+        "media": {
+            "type": "image",
+            "src": "images/placeholder.png"
+        },
+        "abstract": bib.get("abstract", ""),
+        "bibtex": "",
+        "_citations": pub_filled.get("num_citations", 0),  # Bonus: citation count
+    }
+
+
+def fetch_publications(
+    existing_data: Dict[str, Any],
+    registry: Dict[str, str],
+    author_ids: List[str],
+    journal: FetchJournal,
+    workers: int = 4,
+    delay: float = 1.0,
+    client: Any = None,
+) -> Tuple[Dict[str, Any], List[str], Dict[str, Tuple[int, Optional[int]]], Dict[str, Any]]:
+    """Fetch and merge publications from one or more Google Scholar profiles.
 
     Args:
         existing_data: Publications from data.json. Entries here take precedence
                       over Google Scholar data when titles match.
+        registry: Title fingerprint -> ID map (see assign_id); updated in place.
+        author_ids: Scholar author IDs to merge into one catalog.
+        journal: Checkpoint of already-filled publications (see FetchJournal).
+        workers: Number of concurrent Scholar requests.
+        delay: Minimum seconds between Scholar requests, across all workers.
+        client: `scholarly` (the default), or a recorder/replayer from
+                scholar_replay.py.
 
     Strategy:
         1. Start with ALL entries from data.json (preserving your curated data)
-        2. For each Google Scholar publication, check if title matches existing entry
-        3. If match found, skip (data.json version is already included)
-        4. If no match, add as new publication from Scholar
+        2. Fetch every profile's publication list concurrently
+        3. Merge the lists, treating papers with the same title as one
+           (co-authored papers appear once, listing all their profiles)
+        4. Papers matching a data.json entry are skipped (already included)
+        5. The rest are filled concurrently (skipping any already in the
+           journal) and added as new publications
+
+    Returns:
+        (publications, new_ids, citations, profile_stats) where citations maps
+        ID -> (num_citations, year) for every Scholar publication.
+
+    Raises ProfileFetchError if any profile cannot be fetched, and
+    ScholarBlocked if Scholar keeps failing requests.
     """
-    print(f"Fetching profile for scholar ID: {SCHOLAR_ID}")
-
-    # Get author profile
-    author = scholarly.search_author_id(SCHOLAR_ID)
-    author = scholarly.fill(author, sections=["publications"])
-
-    print(f"Found {len(author['publications'])} publications on Google Scholar")
+    client = client or scholarly
+    limiter = RateLimiter(delay)
 
     # Start with ALL existing data.json entries
     publications = dict(existing_data)
     print(f"Starting with {len(publications)} entries from data.json")
 
-    new_ids = []  # Track IDs of new publications from Scholar
-    skipped_count = 0
+    print(f"Fetching {len(author_ids)} profile(s): {', '.join(author_ids)}")
+    profiles = {}
+    profile_stats = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {author_id: executor.submit(fetch_profile, author_id, limiter, client) for author_id in author_ids}
+        for author_id, future in futures.items():
+            try:
+                profiles[author_id] = future.result()
+            except Exception as e:
+                print(f"  Error: Could not fetch profile {author_id}: {e}")
+                errors.append(f"{author_id}: {e}")
+    # A catalog without a profile's papers would drop them from the output
+    if errors:
+        raise ProfileFetchError("; ".join(errors))
+
+    # Merge listings in the order the profiles were given, deduplicating by title
+    merged = {}  # Title fingerprint -> {"pub": listing, "sources": [author ids]}
+    for author_id, author in profiles.items():
+        listed = author.get("publications", [])
+        shared = 0
+        for pub in listed:
+            fingerprint = normalize_title(pub["bib"].get("title", ""))
+            if fingerprint in merged:
+                if author_id not in merged[fingerprint]["sources"]:
+                    merged[fingerprint]["sources"].append(author_id)
+                shared += 1
+            else:
+                merged[fingerprint] = {"pub": pub, "sources": [author_id]}
+        profile_stats[author_id] = {"name": author.get("name", ""), "listed": len(listed), "shared": shared}
+        print(f"  {author_id} ({author.get('name', '')}): {len(listed)} publications, {shared} already listed by another profile")
 
-    for i, pub in enumerate(author["publications"]):
-        # Fetch full publication details (includes abstract, etc.)
-        print(f"  [{i+1}/{len(author['publications'])}] Fetching: {pub['bib'].get('title', 'Unknown')[:50]}...")
+    print(f"Found {len(merged)} unique publications on Google Scholar")
 
-        try:
-            pub_filled = scholarly.fill(pub)
-            time.sleep(1)  # Be respectful to Google Scholar
-        except Exception as e:
-            print(f"    Warning: Could not fetch details: {e}")
-            pub_filled = pub
+    new_ids = []  # Track IDs of new publications from Scholar
+    citations = {}  # ID -> (num_citations, year) for every Scholar publication
+    to_fill = []  # Fingerprints of papers not in data.json
+    skipped_count = 0
 
-        bib = pub_filled.get("bib", {})
-        title = bib.get("title", "Unknown Title")
+    for fingerprint, item in merged.items():
+        pub = item["pub"]
+        title = pub["bib"].get("title", "Unknown Title")
 
         # Check if this title matches any existing entry in data.json (by title similarity)
-        matching_id = find_matching_entry(title, existing_data)
+        matching_id = registry.get(fingerprint)
+        if matching_id not in existing_data:
+            matching_id = find_matching_entry(title, existing_data)
         if matching_id:
-            print(f"    -> Skipped (matches '{matching_id}' in data.json)")
+            citations[matching_id] = (pub.get("num_citations", 0), existing_data[matching_id].get("year"))
+            item["id"] = matching_id
             skipped_count += 1
             continue
 
-        # Generate ID for new publication
-        pub_id = generate_id(title)
-
-        # Handle duplicate IDs by appending year
-        if pub_id in publications:
-            year = bib.get("pub_year", "")
-            pub_id = f"{pub_id}{year}"
-
-        # Still duplicate? Append counter
-        counter = 2
-        original_id = pub_id
-        while pub_id in publications:
-            pub_id = f"{original_id}_{counter}"
-            counter += 1
-
-        # Extract authors
-        authors = parse_authors(bib.get("author", ""))
-
-        # Build links
-        links = {}
-        pub_url = pub_filled.get("pub_url", "")
-        if pub_url:
-            if "arxiv.org" in pub_url:
-                links["arxiv"] = pub_url
-            else:
-                links["paper"] = pub_url
-
-        # Check for arXiv in eprint field
-        eprint = bib.get("eprint", "")
-        if eprint and "arxiv" not in links:
-            links["arxiv"] = f"https://arxiv.org/abs/{eprint}"
-
-        # Build publication entry
-        entry = {
-            "title": title,
-            "authors": authors,
-            "venue": bib.get("venue", bib.get("journal", bib.get("booktitle", ""))),
-            "year": int(bib.get("pub_year")) if bib.get("pub_year") and str(bib.get("pub_year")).isdigit() else None,
-            "links": links,
-            "media": {
-                "type": "image",
-                "src": "images/placeholder.png"
-            },
-            "abstract": bib.get("abstract", ""),
-            "bibtex": "",
-            "_citations": pub_filled.get("num_citations", 0),  # Bonus: citation count
-        }
+        to_fill.append(fingerprint)
+
+    print(f"Skipping {skipped_count} that match data.json, fetching details for {len(to_fill)}...")
+
+    new_entries = fill_with_checkpoints(
+        {fingerprint: merged[fingerprint]["pub"] for fingerprint in to_fill}, journal, limiter, workers, client=client
+    )
 
+    # Assign IDs after fetching, in fingerprint order, so they don't depend on
+    # the order Scholar returned the papers in
+    used = used_ids(registry, publications)
+    for fingerprint in sorted(new_entries):
+        entry = new_entries[fingerprint]
+        entry["_sources"] = merged[fingerprint]["sources"]
+        pub_id = assign_id(registry, entry["title"], entry["year"], used)
         publications[pub_id] = entry
         new_ids.append(pub_id)
-        print(f"    -> ID: {pub_id} (NEW from Google Scholar)")
+        citations[pub_id] = (entry["_citations"], entry["year"])
+        merged[fingerprint]["id"] = pub_id
+        print(f"  {pub_id}: {entry['title'][:60]}")
+
+    for author_id in profiles:
+        ids = [item["id"] for item in merged.values() if author_id in item["sources"]]
+        stats = profile_stats[author_id]
+        stats["ids"] = ids
+        stats["matched_data_json"] = sum(1 for pid in ids if pid in existing_data)
+        stats["new"] = len(ids) - stats["matched_data_json"]
 
     print(f"\nSummary: {skipped_count} matched data.json, {len(new_ids)} new from Scholar")
 
-    return publications, new_ids
+    return publications, new_ids, citations, profile_stats
 
 
 def sort_publications_by_year(publications: Dict[str, Any]) -> Dict[str, Any]:
@@ -252,17 +688,116 @@ def sort_publications_by_year(publications: Dict[str, Any]) -> Dict[str, Any]:
 
     Publications with None/null year are placed at the end.
     """
-    def sort_key(item):
-        pub_id, pub_data = item
-        year = pub_data.get("year")
-        # Put None years at the end by using a very small number
-        return (year is None, -(year or 0))
-
-    sorted_items = sorted(publications.items(), key=sort_key)
+    sorted_items = sorted(publications.items(), key=lambda item: selection.year_key(item[1]))
     return dict(sorted_items)
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Fetch publications from Google Scholar into data_prefetched.json.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python fetch_scholar.py
+    python fetch_scholar.py --author-id SktxU8IAAAAJ --author-id OTHER_ID
+    python fetch_scholar.py --skip-arxiv
+    python fetch_scholar.py --rebuild-registry
+    python fetch_scholar.py --arxiv-api http://localhost:8000/api/query
+    python fetch_scholar.py --record scholar_fixture.json
+    python fetch_scholar.py --replay scholar_fixture.json --replay-latency 0.05
+        """
+    )
+    parser.add_argument(
+        "--author-id",
+        action="append",
+        dest="author_ids",
+        metavar="ID",
+        help=f"Google Scholar author ID; repeat to merge several profiles (default: {SCHOLAR_ID})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent Scholar requests (default: 4)"
+    )
+    parser.add_argument(
+        "--delay",
+        type=float,
+        help="Minimum seconds between Scholar requests, shared by all workers (default: 1, or 0 with --replay)"
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help=f"Ignore progress saved by an interrupted run ({JOURNAL_FILE})"
+    )
+    parser.add_argument(
+        "--rebuild-registry",
+        action="store_true",
+        help=f"Rebuild {REGISTRY_FILE} from {DATA_FILE} and {OUTPUT_FILE}, then exit"
+    )
+    parser.add_argument(
+        "--skip-arxiv",
+        action="store_true",
+        help="Don't fill missing fields of new entries from arXiv"
+    )
+    parser.add_argument(
+        "--arxiv-api",
+        default=ARXIV_API_URL,
+        help=f"arXiv API endpoint (default: {ARXIV_API_URL})"
+    )
+    parser.add_argument(
+        "--lock-timeout",
+        type=float,
+        default=atomic_output.LOCK_TIMEOUT,
+        help=f"Seconds to wait for another build writing {OUTPUT_FILE} (default: {atomic_output.LOCK_TIMEOUT:g})"
+    )
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument(
+        "--record",
+        metavar="FIXTURE",
+        help="Save every Scholar response to this file, for later --replay runs"
+    )
+    replay.add_argument(
+        "--replay",
+        metavar="FIXTURE",
+        help="Answer Scholar requests from a recorded fixture instead of the network (implies --skip-arxiv, "
+             "and doesn't add to the citation history)"
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        help="With --replay, seconds each request takes (default: 0)"
+    )
+    parser.add_argument(
+        "--replay-error-rate",
+        type=float,
+        default=0.0,
+        help="With --replay, fraction of requests that fail (default: 0)"
+    )
+    args = parser.parse_args()
+    delay = args.delay if args.delay is not None else (0.0 if args.replay else 1.0)
+
+    if args.rebuild_registry:
+        catalogs = [load_existing_data()]
+        if os.path.exists(OUTPUT_FILE):
+            catalogs.append(dict(json_stream.iter_publications(OUTPUT_FILE)))
+        registry = build_id_registry(*catalogs)
+        save_id_registry(registry)
+        print(f"Wrote {len(registry)} IDs to {REGISTRY_FILE}")
+        return
+
+    if args.replay:
+        client = scholar_replay.Replay(
+            scholar_replay.load_fixture(args.replay), latency=args.replay_latency, error_rate=args.replay_error_rate
+        )
+    elif scholarly is None:
+        print("Error: 'scholarly' library not installed.")
+        print("Install it with: pip install scholarly")
+        exit(1)
+    else:
+        client = scholar_replay.Recorder(scholarly) if args.record else scholarly
+
     print("=" * 60)
     print("Google Scholar Publication Fetcher")
     print("=" * 60)
@@ -275,7 +810,51 @@ def main():
         print("  (These will take precedence over Google Scholar data)")
         print()
 
-    publications, new_ids = fetch_publications(existing_data)
+    # Reuse IDs assigned by previous runs so anchors and links stay stable
+    registry = load_id_registry()
+    registry.update(build_id_registry(existing_data))  # data.json IDs always win
+
+    journal = FetchJournal(JOURNAL_FILE)
+    if args.fresh:
+        journal.clear()
+
+    author_ids = args.author_ids or [SCHOLAR_ID]
+    try:
+        publications, new_ids, citations, profile_stats = fetch_publications(
+            existing_data, registry, author_ids, journal, workers=args.workers, delay=delay, client=client
+        )
+    except ScholarBlocked as e:
+        print()
+        print(f"Error: Google Scholar appears to be blocking requests ({e}).")
+        print(f"Progress is saved in {JOURNAL_FILE}; run again later to resume.")
+        print(f"{OUTPUT_FILE} was not modified.")
+        exit(1)
+    except ProfileFetchError as e:
+        print()
+        print(f"Error: Could not fetch every profile ({e}).")
+        print(f"{OUTPUT_FILE} and the citation history were not modified.")
+        exit(1)
+    finally:
+        if args.record:
+            client.save(args.record)
+            print(f"Recorded Scholar responses to {args.record}")
+    save_id_registry(registry)
+
+    # Append this run's citation counts to the history (replayed counts aren't new observations)
+    if not args.replay:
+        store = citation_store.open_store()
+        citation_store.record_fetch(store, citations)
+        summary = citation_store.latest_summary(store)
+        store.close()
+        print(f"Recorded citations for {len(citations)} publications "
+              f"(total {summary['total']}, h-index {summary['h_index']})")
+
+    # Fill what Scholar left out (abstracts, truncated authors, bibtex) from arXiv
+    if new_ids and not args.skip_arxiv and not args.replay:
+        print()
+        print("Enriching new entries from arXiv...")
+        enriched = enrich_with_arxiv({pid: publications[pid] for pid in new_ids}, api_url=args.arxiv_api)
+        print(f"  Filled missing fields for {len(enriched)} entries")
 
     # Sort publications by year (most recent first)
     publications = sort_publications_by_year(publications)
@@ -290,19 +869,32 @@ def main():
     new_from_scholar_sorted = [pid for pid in sorted_ids if pid in new_ids]
 
     # Build output structure with summary for easy review
-    output = {
-        "_summary": {
-            "_comment": "Quick reference of all publication IDs (sorted by year, most recent first)",
-            "from_data_json": from_data_json_sorted,
-            "new_from_scholar": new_from_scholar_sorted,
-            "all_ids": sorted_ids
-        },
-        "publications": publications
+    summary = {
+        "_comment": "Quick reference of all publication IDs (sorted by year, most recent first)",
+        "from_data_json": from_data_json_sorted,
+        "new_from_scholar": new_from_scholar_sorted,
+        "all_ids": sorted_ids,
+        "profiles": profile_stats
     }
 
-    # Write to file
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    # Stream entries to a temp file and rename, so readers never see a partial file
+    try:
+        with atomic_output.build_lock(os.path.dirname(os.path.abspath(OUTPUT_FILE)), args.lock_timeout):
+            json_stream.write_catalog(OUTPUT_FILE, publications.items(), summary)
+    except atomic_output.LockTimeout as e:
+        print(f"Error: {e}")
+        print(f"Progress is saved in {JOURNAL_FILE}; run again to write {OUTPUT_FILE}.")
+        exit(1)
+
+    failed = [record["entry"]["title"] for record in journal.records.values() if not record["ok"]]
+    if failed:
+        print()
+        print(f"Warning: {len(failed)} publications could not be fetched and use listing data only:")
+        for title in failed:
+            print(f"  - {title[:60]}")
+        print(f"Run again to retry just these (progress is kept in {JOURNAL_FILE}).")
+    else:
+        journal.clear()
 
     print()
     print("=" * 60)
@@ -1,19 +1,29 @@
 #!/usr/bin/env python3
 """
 Converts resume.md to a nicely formatted .docx matching the HTML style
-Requires: pip install python-docx pyyaml
+Requires: pip install python-docx
 """
 
-import re
-import yaml
+import io
+import zipfile
 from pathlib import Path
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor, Twips
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn, nsmap
+from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+import atomic_output
+import resume_markdown
+import resume_publications
+from resume_markdown import BulletList, Emphasis, Heading, Link, Paragraph, Strong, Text, plain_text
+
+
+# Timestamp stored on every part of the DOCX zip (python-docx stamps the
+# current time), so unchanged resumes produce identical bytes
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
 
 # Colors matching the HTML
 NAVY = RGBColor(26, 54, 93)
@@ -29,46 +39,107 @@ def set_cell_shading(cell, color_hex):
     cell._tc.get_or_add_tcPr().append(shading)
 
 
-def add_bottom_border(paragraph, color_hex="B8860B", width="12"):
-    """Add a bottom border to a paragraph."""
-    pPr = paragraph._p.get_or_add_pPr()
+def add_bottom_border(style, color_hex="B8860B", width="12", space="4"):
+    """Add a bottom border to a paragraph style."""
+    pPr = style.element.get_or_add_pPr()
     pBdr = OxmlElement('w:pBdr')
     bottom = OxmlElement('w:bottom')
     bottom.set(qn('w:val'), 'single')
     bottom.set(qn('w:sz'), width)
+    bottom.set(qn('w:space'), space)
     bottom.set(qn('w:color'), color_hex)
     pBdr.append(bottom)
     pPr.append(pBdr)
 
 
-def set_paragraph_spacing(paragraph, before=0, after=0, line=None):
-    """Set paragraph spacing."""
-    pPr = paragraph._p.get_or_add_pPr()
-    spacing = OxmlElement('w:spacing')
-    spacing.set(qn('w:before'), str(before))
-    spacing.set(qn('w:after'), str(after))
-    if line:
-        spacing.set(qn('w:line'), str(line))
-        spacing.set(qn('w:lineRule'), 'auto')
-    pPr.append(spacing)
-
-
-def parse_markdown(md_path: Path) -> tuple[dict, str]:
-    """Parse YAML front matter and markdown content."""
-    text = md_path.read_text()
-    match = re.match(r'^---\n(.*?)\n---\n(.*)$', text, re.DOTALL)
-    if match:
-        front_matter = yaml.safe_load(match.group(1))
-        content = match.group(2)
-        return front_matter, content
-    return {}, text
-
-
-def create_resume_docx(md_path: Path, output_path: Path):
-    """Create a formatted DOCX from the markdown resume."""
-    front_matter, content = parse_markdown(md_path)
+# Named styles: (name, font, size in pt, color, bold, italic, space before/after in twips)
+PARAGRAPH_STYLES = [
+    ("Resume Name", "Arial", 28, RGBColor(255, 255, 255), True, False, 200, 100),
+    ("Resume Title", "Georgia", 12, GOLD, False, True, 0, 200),
+    ("Resume Contact", "Arial", 9, MEDIUM_GRAY, False, False, 150, 150),
+    ("Resume H2", "Arial", 11, NAVY, True, False, 300, 150),
+    ("Resume H3", "Arial", 12, NAVY, True, False, 250, 50),
+    ("Resume H4", "Arial", 10, GOLD, True, False, 180, 80),
+    ("Resume Role", "Georgia", 11, DARK_GRAY, True, False, 0, 0),
+    ("Resume Date", "Georgia", 10, MEDIUM_GRAY, False, True, 0, 100),
+    ("Resume Bullet", "Georgia", 11, None, False, False, 0, 60),
+    ("Resume Sub-bullet", "Georgia", 11, None, False, False, 0, 60),
+    ("Resume Body", "Georgia", 11, None, False, False, 0, 120),
+]
+
+# (name, color, bold, italic, underline, size in pt)
+CHARACTER_STYLES = [
+    ("Resume Strong", NAVY, True, False, False, None),
+    ("Resume Emphasis", None, False, True, False, None),
+    ("Resume Link", NAVY, False, False, True, None),
+    ("Resume Bullet Mark", GOLD, False, False, False, 10),
+]
+
+
+def define_styles(doc):
+    """Create the resume's paragraph and character styles once per document.
+
+    Fonts, spacing and borders live in the style definitions, so each
+    paragraph and run only references a style name.
+    """
+    styles = doc.styles
+    for name, font, size, color, bold, italic, before, after in PARAGRAPH_STYLES:
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = styles['Normal']
+        style.quick_style = True
+        style.font.name = font
+        style.font.size = Pt(size)
+        style.font.bold = bold
+        style.font.italic = italic
+        if color is not None:
+            style.font.color.rgb = color
+        style.paragraph_format.space_before = Twips(before)
+        style.paragraph_format.space_after = Twips(after)
+
+    styles['Resume Name'].paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    styles['Resume Title'].paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    styles['Resume Contact'].paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    styles['Resume Sub-bullet'].paragraph_format.left_indent = Inches(0.3)
+    styles['Resume H3'].paragraph_format.keep_with_next = True
+    styles['Resume H4'].paragraph_format.keep_with_next = True
+    add_bottom_border(styles['Resume Contact'], "B8860B", "18")  # Gold border
+    add_bottom_border(styles['Resume H2'], "B8860B", "12", space="6")  # Gold underline
+    styles['Resume H2'].paragraph_format.keep_with_next = True
+
+    for name, color, bold, italic, underline, size in CHARACTER_STYLES:
+        style = styles.add_style(name, WD_STYLE_TYPE.CHARACTER)
+        style.font.bold = bold
+        style.font.italic = italic
+        style.font.underline = underline
+        if color is not None:
+            style.font.color.rgb = color
+        if size is not None:
+            style.font.size = Pt(size)
+
+
+def stable_docx_bytes(doc) -> bytes:
+    """Serialize a document with fixed zip timestamps, so the bytes depend only on its content."""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    stable = io.BytesIO()
+    with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(stable, "w") as target:
+        for info in source.infolist():
+            part = zipfile.ZipInfo(info.filename, ZIP_DATE_TIME)
+            part.compress_type = info.compress_type
+            part.external_attr = info.external_attr
+            target.writestr(part, source.read(info))
+    return stable.getvalue()
+
+
+def create_resume_docx(md_path: Path, output_path: Path, document=None):
+    """Create a formatted DOCX from the markdown resume (or its parsed document)."""
+    if document is None:
+        document = resume_markdown.parse_file(md_path)
+    document = resume_publications.expand(document)
+    front_matter = document.meta
 
     doc = Document()
+    define_styles(doc)
 
     # Set narrow margins
     for section in doc.sections:
@@ -86,24 +157,12 @@ def create_resume_docx(md_path: Path, output_path: Path):
 
     # Name
     name_para = header_cell.paragraphs[0]
-    name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    set_paragraph_spacing(name_para, before=200, after=100)
-    name_run = name_para.add_run(front_matter.get('name', '').upper())
-    name_run.bold = True
-    name_run.font.size = Pt(28)
-    name_run.font.color.rgb = RGBColor(255, 255, 255)  # White
-    name_run.font.name = 'Arial'
+    name_para.style = 'Resume Name'
+    name_para.add_run(front_matter.get('name', '').upper())
 
     # Title
     if front_matter.get('title'):
-        title_para = header_cell.add_paragraph()
-        title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        set_paragraph_spacing(title_para, before=0, after=200)
-        title_run = title_para.add_run(front_matter['title'])
-        title_run.italic = True
-        title_run.font.size = Pt(12)
-        title_run.font.color.rgb = GOLD
-        title_run.font.name = 'Georgia'
+        header_cell.add_paragraph(front_matter['title'], style='Resume Title')
 
     # === CONTACT BAR ===
     contact_parts = []
@@ -119,128 +178,83 @@ def create_resume_docx(md_path: Path, output_path: Path):
         contact_parts.append("Google Scholar")
 
     if contact_parts:
-        contact_para = doc.add_paragraph()
-        contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        set_paragraph_spacing(contact_para, before=150, after=150)
-        add_bottom_border(contact_para, "B8860B", "18")  # Gold border
-        contact_run = contact_para.add_run('  \u25c6  '.join(contact_parts))
-        contact_run.font.size = Pt(9)
-        contact_run.font.name = 'Arial'
-        contact_run.font.color.rgb = MEDIUM_GRAY
+        doc.add_paragraph('  \u25c6  '.join(contact_parts), style='Resume Contact')
 
     # === MAIN CONTENT ===
-    lines = content.strip().split('\n')
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # H2 - Section headers (EXECUTIVE SUMMARY, EXPERIENCE, etc.)
-        if line.startswith('## '):
-            header_text = line[3:].strip()
-            para = doc.add_paragraph()
-            set_paragraph_spacing(para, before=300, after=100)
-            run = para.add_run(header_text.upper())
-            run.bold = True
-            run.font.size = Pt(11)
-            run.font.color.rgb = NAVY
-            run.font.name = 'Arial'
-            # Add gold underline
-            underline_para = doc.add_paragraph()
-            set_paragraph_spacing(underline_para, before=0, after=150)
-            add_bottom_border(underline_para, "B8860B", "12")
-
-        # H3 - Company/School names
-        elif line.startswith('### '):
-            header_text = line[4:].strip()
-            para = doc.add_paragraph()
-            set_paragraph_spacing(para, before=250, after=50)
-            run = para.add_run(header_text)
-            run.bold = True
-            run.font.size = Pt(12)
-            run.font.color.rgb = NAVY
-            run.font.name = 'Arial'
-
-        # H4 - Role subsections (Data & Infrastructure, etc.)
-        elif line.startswith('#### '):
-            header_text = line[5:].strip()
-            para = doc.add_paragraph()
-            set_paragraph_spacing(para, before=180, after=80)
-            run = para.add_run(header_text)
-            run.bold = True
-            run.font.size = Pt(10)
-            run.font.color.rgb = GOLD
-            run.font.name = 'Arial'
-
-        # List items
-        elif line.startswith('- '):
-            item_text = line[2:].strip()
-            para = doc.add_paragraph()
-            set_paragraph_spacing(para, before=0, after=60)
-            # Add bullet character
-            bullet_run = para.add_run('\u25b8  ')  # Triangle bullet like HTML
-            bullet_run.font.color.rgb = GOLD
-            bullet_run.font.size = Pt(10)
-            add_formatted_text(para, item_text)
-
-        # Bold lines (role titles like "Research Scientist | Technical Lead")
-        elif line.startswith('**') and line.endswith('**'):
-            text = line[2:-2]
-            para = doc.add_paragraph()
-            set_paragraph_spacing(para, before=0, after=0)
-            run = para.add_run(text)
-            run.bold = True
-            run.font.size = Pt(11)
-            run.font.name = 'Georgia'
-            run.font.color.rgb = DARK_GRAY
-
-        # Italic lines (dates)
-        elif line.startswith('*') and line.endswith('*') and not line.startswith('**'):
-            text = line[1:-1]
-            para = doc.add_paragraph()
-            set_paragraph_spacing(para, before=0, after=100)
-            run = para.add_run(text)
-            run.italic = True
-            run.font.size = Pt(10)
-            run.font.color.rgb = MEDIUM_GRAY
-            run.font.name = 'Georgia'
-
-        # Regular paragraphs
-        elif line.strip():
-            para = doc.add_paragraph()
-            set_paragraph_spacing(para, before=0, after=120)
-            add_formatted_text(para, line)
-
-        i += 1
-
-    doc.save(output_path)
-    print(f"Successfully created: {output_path}")
-
-
-def add_formatted_text(para, text):
-    """Add text with bold/italic markdown formatting."""
-    # Pattern for **bold**, *italic*, and [links](url)
-    pattern = r'(\*\*.*?\*\*|\*[^*]+?\*|\[.*?\]\(.*?\))'
-    parts = re.split(pattern, text)
-
-    for part in parts:
-        if part.startswith('**') and part.endswith('**'):
-            run = para.add_run(part[2:-2])
-            run.bold = True
-            run.font.color.rgb = NAVY
-        elif part.startswith('*') and part.endswith('*'):
-            run = para.add_run(part[1:-1])
-            run.italic = True
-        elif part.startswith('[') and '](' in part:
-            # Link: [text](url) - just show text
-            link_match = re.match(r'\[(.*?)\]\((.*?)\)', part)
-            if link_match:
-                run = para.add_run(link_match.group(1))
-                run.font.color.rgb = NAVY
-                run.underline = True
+    for block in document.blocks:
+        if isinstance(block, Heading):
+            text = plain_text(block.inlines)
+            if block.level <= 2:
+                # Section headers (EXECUTIVE SUMMARY, EXPERIENCE, etc.)
+                doc.add_paragraph(text.upper(), style='Resume H2')
+            else:
+                # H3 - Company/School names, H4 - Role subsections
+                doc.add_paragraph(text, style='Resume H3' if block.level == 3 else 'Resume H4')
+
+        elif isinstance(block, BulletList):
+            add_list_items(doc, block.items)
+
+        elif isinstance(block, Paragraph):
+            for inlines in block.lines:
+                if len(inlines) == 1 and isinstance(inlines[0], Strong):
+                    # Bold lines (role titles like "Research Scientist | Technical Lead")
+                    doc.add_paragraph(plain_text(inlines), style='Resume Role')
+                elif len(inlines) == 1 and isinstance(inlines[0], Emphasis):
+                    # Italic lines (dates)
+                    doc.add_paragraph(plain_text(inlines), style='Resume Date')
+                else:
+                    add_formatted_text(doc.add_paragraph(style='Resume Body'), inlines)
+
+    # Save in memory, then swap the file in (unchanged files are left alone)
+    atomic_output.write_bytes(str(output_path), stable_docx_bytes(doc))
+
+
+def add_list_items(doc, items, depth=0):
+    """Add bullet paragraphs for list items, nested items indented."""
+    style = 'Resume Bullet' if depth == 0 else 'Resume Sub-bullet'
+    for item in items:
+        para = doc.add_paragraph(style=style)
+        para.add_run('\u25b8  ', style='Resume Bullet Mark')  # Triangle bullet like HTML
+        add_formatted_text(para, item.inlines)
+        add_list_items(doc, item.children, depth + 1)
+
+
+INLINE_STYLES = {Strong: 'Resume Strong', Emphasis: 'Resume Emphasis', Link: 'Resume Link'}
+
+
+def inherit_formatting(run, outer_styles, style):
+    """Add the bold/italic/underline/color of enclosing styles that `style` lacks.
+
+    A run has a single character style, so `**bold *italic* bold**` gives the
+    inner run 'Resume Emphasis' plus direct bold formatting from 'Resume Strong'.
+    """
+    formats = {name: (color, bold, italic, underline) for name, color, bold, italic, underline, _ in CHARACTER_STYLES}
+    color, bold, italic, underline = formats[style]
+    for outer in reversed(outer_styles):  # innermost enclosing style first
+        outer_color, outer_bold, outer_italic, outer_underline = formats[outer]
+        if outer_bold and not bold:
+            run.font.bold = bold = True
+        if outer_italic and not italic:
+            run.font.italic = italic = True
+        if outer_underline and not underline:
+            run.font.underline = underline = True
+        if outer_color is not None and color is None:
+            run.font.color.rgb = color = outer_color
+
+
+def add_formatted_text(para, inlines, styles=()):
+    """Add runs for parsed inline markup (bold, italic, links show their text).
+
+    `styles` are the character styles of the enclosing nodes, outermost first;
+    nested markup combines them instead of the innermost one replacing the rest.
+    """
+    for node in inlines:
+        if isinstance(node, Text):
+            run = para.add_run(node.text, style=styles[-1] if styles else None)
+            if len(styles) > 1:
+                inherit_formatting(run, styles[:-1], styles[-1])
         else:
-            run = para.add_run(part)
-            run.font.name = 'Georgia'
-            run.font.size = Pt(11)
+            add_formatted_text(para, node.children, styles + (INLINE_STYLES[type(node)],))
 
 
 if __name__ == "__main__":
@@ -248,3 +262,4 @@ if __name__ == "__main__":
     md_path = script_dir / "resume.md"
     output_path = script_dir / "resume.docx"
     create_resume_docx(md_path, output_path)
+    print(f"Successfully created: {output_path}")
@@ -1,42 +1,24 @@
-// from: http://www.robots.ox.ac.uk/~vedaldi/assets/hidebib.js
-function hideallbibs()
-{
-    var el = document.getElementsByTagName("div") ;
-    for (var i = 0 ; i < el.length ; ++i) {
-        if (el[i].className == "paper") {
-            var bib = el[i].getElementsByTagName("pre") ;
-            if (bib.length > 0) {
-                bib [0] .style.display = 'none' ;
-            }
-        }
-    }
-}
-
-function togglebib(paperid)
-{
-    var paper = document.getElementById(paperid) ;
-    var bib = paper.getElementsByTagName('pre') ;
-    if (bib.length > 0) {
-        if (bib [0] .style.display == 'none') {
-            bib [0] .style.display = 'block' ;
-        } else {
-            bib [0] .style.display = 'none' ;
-        }
-    }
-}
+// Abstract/BibTeX toggles, originally from:
+// http://www.robots.ox.ac.uk/~vedaldi/assets/hidebib.js
+//
+// Rows mark their toggle links with data-toggle="abstract" or "bibtex".
+// Whether a block is shown is a class on its div.paper (show-abstract,
+// show-bibtex) that the page's CSS acts on, so nothing runs per row at load
+// time: one click listener on the document serves every row.
 
-function toggleblock(blockId)
+function togglepaper(paper, block)
 {
-   var block = document.getElementById(blockId);
-   if (block.style.display == 'none') {
-    block.style.display = 'block' ;
-   } else {
-    block.style.display = 'none' ;
-   }
+    paper.classList.toggle('show-' + block) ;
 }
 
-function hideblock(blockId)
-{
-   var block = document.getElementById(blockId);
-   block.style.display = 'none' ;
-}
\ No newline at end of file
+document.addEventListener('click', function (event) {
+    var link = event.target.closest ? event.target.closest('a[data-toggle]') : null ;
+    if (!link) {
+        return ;
+    }
+    var paper = link.closest('div.paper') ;
+    if (paper) {
+        event.preventDefault() ;
+        togglepaper(paper, link.getAttribute('data-toggle')) ;
+    }
+}) ;
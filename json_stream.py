@@ -0,0 +1,218 @@
+"""
+Incremental reader/writer for publication catalogs (data.json, data_prefetched.json).
+
+The files keep their usual layout:
+
+    {
+      "_summary": {...},
+      "publications": {"ID": {...}, ...}
+    }
+
+but are written one publication at a time, and can be read back the same way:
+`read_summary` stops as soon as the summary is parsed, and
+`iter_publications` yields (id, publication) pairs without materializing the
+whole document. `rewrite_field` edits one field of chosen publications in
+place, leaving the rest of a hand-formatted file byte-for-byte as it was.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+import atomic_output
+
+
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+
+class _StreamDecoder:
+    """Decode JSON values one at a time from a file, reading it in chunks."""
+
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {self.buf[self.pos]!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Iterate the keys of the object at the current position.
+
+        The caller must consume each member's value (e.g. with value())
+        before asking for the next key.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or '}}' at offset {self.pos - 1}, found {char!r}")
+
+
+def read_summary(path: str) -> Optional[Dict[str, Any]]:
+    """Read only the `_summary` header of a catalog (None if it has none)."""
+    with open(path, "r", encoding="utf-8") as f:
+        decoder = _StreamDecoder(f)
+        for key in decoder.members():
+            if key == "_summary":
+                return decoder.value()
+            decoder.value()
+    return None
+
+
+def iter_publications(path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (id, publication) pairs from a catalog, one at a time."""
+    with open(path, "r", encoding="utf-8") as f:
+        decoder = _StreamDecoder(f)
+        for key in decoder.members():
+            if key != "publications":
+                decoder.value()
+                continue
+            for pub_id in decoder.members():
+                yield pub_id, decoder.value()
+            return
+
+
+def _indented(value: Any, indent: int) -> str:
+    """json.dumps with indent=2, shifted right to sit at the given nesting depth."""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + " " * indent)
+
+
+def write_catalog(
+    path: str,
+    publications: Iterable[Tuple[str, Dict[str, Any]]],
+    summary: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Write a catalog one publication at a time, atomically.
+
+    Output is byte-for-byte what json.dump(..., indent=2, ensure_ascii=False)
+    produces for the same document, plus a trailing newline (as with
+    atomic_output.write_json); an unchanged file is left untouched.
+    Returns the number of publications written.
+    """
+    count = 0
+    with atomic_output.open_atomic(path) as f:
+        f.write("{\n")
+        if summary is not None:
+            f.write(f'  "_summary": {_indented(summary, 2)},\n')
+        f.write('  "publications": {')
+        for pub_id, pub in publications:
+            f.write(",\n" if count else "\n")
+            f.write(f"    {json.dumps(pub_id, ensure_ascii=False)}: {_indented(pub, 4)}")
+            count += 1
+        f.write("\n  }\n}\n" if count else "}\n}\n")
+    return count
+
+
+def _members(text: str, pos: int) -> Iterator[Tuple[str, int, int]]:
+    """Yield (key, value start, value end) for the object starting at text[pos]."""
+    pos = _WHITESPACE.match(text, pos).end()
+    if text[pos] != "{":
+        raise ValueError(f"Expected '{{' at offset {pos}, found {text[pos]!r}")
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    if text[pos] == "}":
+        return
+    while True:
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = _WHITESPACE.match(text, pos).end()
+        if text[pos] != ":":
+            raise ValueError(f"Expected ':' at offset {pos}, found {text[pos]!r}")
+        start = _WHITESPACE.match(text, pos + 1).end()
+        _, end = _decoder.raw_decode(text, start)
+        yield key, start, end
+        pos = _WHITESPACE.match(text, end).end()
+        if text[pos] == "}":
+            return
+        if text[pos] != ",":
+            raise ValueError(f"Expected ',' or '}}' at offset {pos}, found {text[pos]!r}")
+        pos = _WHITESPACE.match(text, pos + 1).end()
+
+
+def _format_like(value: Any, original: str, indent: int) -> str:
+    """Serialize `value` inline if `original` was on one line, else indented."""
+    if "\n" not in original:
+        return json.dumps(value, ensure_ascii=False)
+    return _indented(value, indent)
+
+
+def rewrite_field(path: str, field: str, values: Dict[str, Any]) -> bool:
+    """Set `field` of the publications in `values` ({pub_id: new value}), in place.
+
+    Only those values are re-serialized, in the layout they already had
+    (inline or indented); every other byte of the file is kept, so
+    hand-formatted catalogs such as data.json stay diff-friendly. The whole
+    file is read into memory. Returns False if nothing changed.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    edits = []
+    for key, start, _ in _members(text, 0):
+        if key != "publications":
+            continue
+        for pub_id, pub_start, _ in _members(text, start):
+            if pub_id not in values:
+                continue
+            for name, value_start, value_end in _members(text, pub_start):
+                if name == field:
+                    line_start = text.rfind("\n", 0, value_start) + 1
+                    indent = len(text[line_start:value_start]) - len(text[line_start:value_start].lstrip(" "))
+                    edits.append((value_start, value_end, _format_like(values[pub_id], text[value_start:value_end], indent)))
+                    break
+            else:
+                raise KeyError(f"{pub_id} has no {field!r} field in {path}")
+        break
+
+    for start, end, replacement in sorted(edits, reverse=True):
+        text = text[:start] + replacement + text[end:]
+    return atomic_output.write_text(path, text)
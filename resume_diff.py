@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Compare resume variants section by section and bullet by bullet.
+
+Usage:
+    python resume_diff.py                              # all resume*.md
+    python resume_diff.py resume.md resume_combined.md resume_combined_layout.md
+    python resume_diff.py --all                        # include bullets every variant shares
+
+Every ##/###/#### section and every bullet is fingerprinted from its
+normalized text (case, spacing and markup are ignored). All variants are
+indexed into one fingerprint -> variants map in a single pass, so the
+result is an N-way structural diff rather than pairwise text diffs:
+
+- a section matrix (same letter = identical content, "-" = missing), and
+- a bullet merge matrix showing which bullets appear in which variants.
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import re
+import string
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+import resume_markdown
+import resume_publications
+from resume_markdown import BulletList, Heading, ListItem, Paragraph, plain_text
+
+
+_SPACES = re.compile(r"\s+")
+_TRAILING = re.compile(r"[\s.;,:]+$")
+
+
+class Bullet(NamedTuple):
+    fingerprint: str
+    text: str
+    section: str
+    depth: int
+
+
+def normalize(text: str) -> str:
+    """Case-, spacing- and trailing-punctuation-insensitive form of a line."""
+    return _TRAILING.sub("", _SPACES.sub(" ", text).strip().lower())
+
+
+def fingerprint(text: str) -> str:
+    return hashlib.sha1(normalize(text).encode("utf-8")).hexdigest()[:12]
+
+
+def _items(items: List[ListItem], depth: int = 0) -> Iterator[Tuple[ListItem, int]]:
+    for item in items:
+        yield item, depth
+        yield from _items(item.children, depth + 1)
+
+
+def index_variant(document: resume_markdown.Document) -> Tuple[Dict[str, str], List[Bullet]]:
+    """Fingerprint a parsed resume's sections and bullets in one pass.
+
+    Returns ({section path: content fingerprint}, [Bullet, ...]). A section's
+    content covers everything under its heading, including subsections.
+    """
+    sections: Dict[str, str] = {}
+    bullets: List[Bullet] = []
+    open_sections: List[Tuple[int, str, "hashlib._Hash"]] = []  # (level, path, running hash)
+
+    def close(level: int) -> None:
+        while open_sections and open_sections[-1][0] >= level:
+            _, path, digest = open_sections.pop()
+            sections[path] = digest.hexdigest()[:12]
+
+    def feed(text: str) -> None:
+        line = (normalize(text) + "\n").encode("utf-8")
+        for _, _, digest in open_sections:
+            digest.update(line)
+
+    for block in document.blocks:
+        if isinstance(block, Heading):
+            if block.level < 2:
+                continue
+            close(block.level)
+            title = normalize(plain_text(block.inlines))
+            path = " / ".join([p for _, p, _ in open_sections[-1:]] + [title]) if open_sections else title
+            sections[path] = ""  # Reserve the slot so sections keep document order
+            open_sections.append((block.level, path, hashlib.sha1()))
+        elif isinstance(block, Paragraph):
+            for line in block.lines:
+                feed(plain_text(line))
+        elif isinstance(block, BulletList):
+            section = open_sections[-1][1] if open_sections else "(top)"
+            for item, depth in _items(block.items):
+                text = plain_text(item.inlines)
+                feed("  " * depth + text)
+                bullets.append(Bullet(fingerprint(text), text, section, depth))
+    close(0)
+    return sections, bullets
+
+
+def compare(paths: List[Path]) -> Tuple[Dict[str, List[str]], Dict[str, Tuple[Bullet, List[bool]]]]:
+    """Index all variants into shared hash maps.
+
+    Returns ({section path: [fingerprint or "" per variant]},
+             {bullet fingerprint: (first occurrence, [present per variant])}),
+    both in first-seen order.
+    """
+    section_matrix: Dict[str, List[str]] = {}
+    bullet_matrix: Dict[str, Tuple[Bullet, List[bool]]] = {}
+    for column, path in enumerate(paths):
+        sections, bullets = index_variant(resume_publications.expand(resume_markdown.parse_file(path)))
+        for section, digest in sections.items():
+            section_matrix.setdefault(section, [""] * len(paths))[column] = digest
+        for bullet in bullets:
+            bullet_matrix.setdefault(bullet.fingerprint, (bullet, [False] * len(paths)))[1][column] = True
+    return section_matrix, bullet_matrix
+
+
+def content_letters(digests: List[str]) -> List[str]:
+    """Label each variant's content: same letter = same content, "-" = missing."""
+    letters: Dict[str, str] = {}
+    labels = []
+    for digest in digests:
+        if not digest:
+            labels.append("-")
+            continue
+        if digest not in letters:
+            letters[digest] = string.ascii_uppercase[len(letters) % 26]
+        labels.append(letters[digest])
+    return labels
+
+
+def shorten(text: str, width: int) -> str:
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Show which sections and bullets differ across resume variants.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python resume_diff.py
+    python resume_diff.py resume_combined.md resume_combined_layout.md
+    python resume_diff.py --sections-only
+        """
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        default=["resume*.md"],
+        help="Markdown files or glob patterns (default: resume*.md)"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Also list sections and bullets that are identical in every variant"
+    )
+    parser.add_argument(
+        "--sections-only",
+        action="store_true",
+        help="Only print the section matrix"
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=100,
+        help="Maximum line width (default: 100)"
+    )
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    paths = sorted({
+        Path(path) for pattern in args.patterns
+        for path in glob.glob(pattern if os.path.isabs(pattern) else str(script_dir / pattern))
+    })
+    if len(paths) < 2:
+        print("Need at least two resume files to compare.")
+        return
+
+    section_matrix, bullet_matrix = compare(paths)
+    columns = " ".join(str(i % 10) for i in range(1, len(paths) + 1))
+    label_width = max(20, args.width - len(columns) - 2)
+
+    print("Variants:")
+    for i, path in enumerate(paths, start=1):
+        print(f"  {i % 10}  {path.name}")
+
+    print("\nSections (same letter = same content, - = missing)")
+    print(f"{'':<{label_width}}  {columns}")
+    shown = 0
+    for section, digests in section_matrix.items():
+        labels = content_letters(digests)
+        if not args.all and len(set(labels)) == 1:
+            continue
+        print(f"{shorten(section, label_width):<{label_width}}  {' '.join(labels)}")
+        shown += 1
+    if not args.all:
+        print(f"({shown} of {len(section_matrix)} sections differ)")
+
+    if args.sections_only:
+        return
+
+    print("\nBullets (x = present)")
+    current_section = None
+    shown = 0
+    for bullet, present in bullet_matrix.values():
+        if not args.all and all(present):
+            continue
+        if bullet.section != current_section:
+            current_section = bullet.section
+            print(f"  [{shorten(current_section, args.width - 4)}]")
+        marks = " ".join("x" if p else "." for p in present)
+        text = "  " * bullet.depth + bullet.text
+        print(f"    {marks}  {shorten(text, args.width - len(marks) - 6)}")
+        shown += 1
+    total = len(bullet_matrix)
+    print(f"\n{shown} of {total} distinct bullets are missing from at least one variant" if not args.all else f"\n{total} distinct bullets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Single-pass parser for the resume markdown files (resume*.md).
+
+Produces a small AST shared by html_to_docx.py and view_resume.py:
+
+    Document(meta={"name": ..., ...}, blocks=[
+        Heading(level=2, inlines=[Text("Experience")]),
+        Paragraph(lines=[[Strong([Text("Research Scientist")])], [Emphasis([Text("2024 - Present")])]]),
+        BulletList(items=[ListItem(inlines=[...], children=[ListItem(...)])]),
+        Rule(),
+        Publications(filters={"ids": "UALM,FUGATTO"}),   # filled in from data.json
+    ])
+
+Resume files are line-oriented, so a Paragraph keeps its source lines
+separately (the DOCX writer turns each into its own paragraph, the HTML
+viewer joins them with <br>). Front matter is flat `key: value` YAML.
+Inline markup is **bold**, *italic* and [text](url), and may nest.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Union
+
+
+class Text(NamedTuple):
+    text: str
+
+
+class Strong(NamedTuple):
+    children: List["Inline"]
+
+
+class Emphasis(NamedTuple):
+    children: List["Inline"]
+
+
+class Link(NamedTuple):
+    children: List["Inline"]
+    url: str
+
+
+Inline = Union[Text, Strong, Emphasis, Link]
+
+
+class Heading(NamedTuple):
+    level: int
+    inlines: List[Inline]
+
+
+class Paragraph(NamedTuple):
+    lines: List[List[Inline]]
+
+
+class ListItem(NamedTuple):
+    inlines: List[Inline]
+    children: List["ListItem"]
+
+
+class BulletList(NamedTuple):
+    items: List[ListItem]
+
+
+class Rule(NamedTuple):
+    pass
+
+
+class Publications(NamedTuple):
+    """A `<!-- publications: key=value ... -->` directive (see resume_publications.py)."""
+    filters: Dict[str, str]
+
+
+Block = Union[Heading, Paragraph, BulletList, Rule, Publications]
+
+
+class Document(NamedTuple):
+    meta: Dict[str, str]
+    blocks: List[Block]
+
+
+_FRONT_MATTER = re.compile(r"\A---\n(.*?)\n---\n", re.DOTALL)
+_LINE = re.compile(
+    r"(?P<indent>[ \t]*)(?:"
+    r"(?P<rule>(?:-[ \t]*){3,}|(?:\*[ \t]*){3,})$"
+    r"|(?P<hashes>#{1,6})[ \t]+(?P<heading>.*?)[ \t#]*$"
+    r"|[-*+][ \t]+(?P<item>.*)"
+    r"|<!--[ \t]*publications:?(?P<publications>.*?)-->[ \t]*$"
+    r"|(?P<text>\S.*)"
+    r")?$"
+)
+_INLINE = re.compile(r"\*\*(?P<strong>.+?)\*\*|\*(?P<em>[^*\s](?:[^*]*[^*\s])?)\*|\[(?P<label>[^\]]+)\]\((?P<url>[^)\s]+)\)")
+
+
+def parse_inline(text: str) -> List[Inline]:
+    """Split a line into Text/Strong/Emphasis/Link nodes (markup may nest)."""
+    nodes = []
+    pos = 0
+    for match in _INLINE.finditer(text):
+        if match.start() > pos:
+            nodes.append(Text(text[pos:match.start()]))
+        if match.group("strong") is not None:
+            nodes.append(Strong(parse_inline(match.group("strong"))))
+        elif match.group("em") is not None:
+            nodes.append(Emphasis(parse_inline(match.group("em"))))
+        else:
+            nodes.append(Link(parse_inline(match.group("label")), match.group("url")))
+        pos = match.end()
+    if pos < len(text):
+        nodes.append(Text(text[pos:]))
+    return nodes
+
+
+def plain_text(inlines: List[Inline]) -> str:
+    """Concatenated text of inline nodes, without markup."""
+    return "".join(node.text if isinstance(node, Text) else plain_text(node.children) for node in inlines)
+
+
+def parse_front_matter(text: str) -> Dict[str, str]:
+    """Parse flat `key: value` front matter (surrounding quotes are stripped)."""
+    meta = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key.strip() and not key.startswith((" ", "#")):
+            value = value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+                value = value[1:-1]
+            meta[key.strip()] = value
+    return meta
+
+
+def parse(text: str) -> Document:
+    """Parse resume markdown into a Document in one pass over its lines."""
+    meta = {}
+    match = _FRONT_MATTER.match(text)
+    if match:
+        meta = parse_front_matter(match.group(1))
+        text = text[match.end():]
+
+    blocks: List[Block] = []
+    paragraph = None   # Paragraph being extended by consecutive lines
+    stack = []         # (indent, items list) for the open (nested) list
+
+    for line in text.splitlines():
+        m = _LINE.match(line)
+        if m is None or not line.strip():
+            paragraph = None
+            stack = []
+            continue
+
+        if m.group("item") is not None:
+            paragraph = None
+            indent = len(m.group("indent").expandtabs(4))
+            item = ListItem(parse_inline(m.group("item").strip()), [])
+            while stack and indent < stack[-1][0]:
+                stack.pop()
+            if not stack:
+                items = []
+                blocks.append(BulletList(items))
+                stack.append((indent, items))
+            elif indent > stack[-1][0] and stack[-1][1]:
+                children = stack[-1][1][-1].children
+                stack.append((indent, children))
+            stack[-1][1].append(item)
+            continue
+
+        stack = []
+        if m.group("rule") is not None:
+            paragraph = None
+            blocks.append(Rule())
+        elif m.group("publications") is not None:
+            paragraph = None
+            filters = dict(pair.partition("=")[::2] for pair in m.group("publications").split())
+            blocks.append(Publications(filters))
+        elif m.group("hashes") is not None:
+            paragraph = None
+            blocks.append(Heading(len(m.group("hashes")), parse_inline(m.group("heading"))))
+        else:
+            inlines = parse_inline(m.group("text").rstrip())
+            if paragraph is None:
+                paragraph = Paragraph([])
+                blocks.append(paragraph)
+            paragraph.lines.append(inlines)
+
+    return Document(meta, blocks)
+
+
+def parse_file(path: Path) -> Document:
+    """Parse a resume markdown file."""
+    return parse(Path(path).read_text(encoding="utf-8"))
@@ -0,0 +1,161 @@
+"""
+Selected-publications blocks for the resumes, generated from data.json.
+
+A resume opts in with a directive line where the list should go:
+
+    ## Selected Publications
+
+    <!-- publications: ids=UALM,FUGATTO,WAVEGLOW -->
+    <!-- publications: venue=ICLR,NeurIPS minYear=2023 limit=8 -->
+
+Filters: `ids` (comma-separated, kept in that order), `venue` (any of the
+comma-separated names, matched as words in the venue), `year`, `minYear`,
+`maxYear`, `limit` and `data` (catalog file, default data.json). Without
+`ids`, matches are listed newest first.
+
+Each directive becomes an ordinary bullet list ("**Title (year)** | [Venue
+year](link)"), so the DOCX and HTML renderers style it like any other list.
+Catalogs are loaded once per file version and indexed by ID, year and venue
+word.
+"""
+
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from resume_markdown import BulletList, Document, Link, ListItem, Publications, Strong, Text
+
+
+DATA_FILE = "data.json"
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+class PublicationIndex:
+    """A catalog's publications indexed by ID, year and lowercase venue word."""
+
+    def __init__(self, publications: Dict[str, Dict[str, Any]]):
+        self.publications = publications
+        self.order = {pub_id: i for i, pub_id in enumerate(publications)}
+        self.by_year: Dict[int, Set[str]] = {}
+        self.by_venue_word: Dict[str, Set[str]] = {}
+        for pub_id, pub in publications.items():
+            if pub.get("year"):
+                self.by_year.setdefault(pub["year"], set()).add(pub_id)
+            for word in _WORD.findall((pub.get("venue") or "").lower()):
+                self.by_venue_word.setdefault(word, set()).add(pub_id)
+
+    def select(
+        self,
+        ids: Optional[List[str]] = None,
+        venues: Optional[List[str]] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """(id, publication) pairs matching every given filter."""
+        candidates: Optional[Set[str]] = set(ids) & self.publications.keys() if ids else None
+
+        if venues:
+            matches = set()
+            for venue in venues:
+                words = _WORD.findall(venue.lower())
+                if words:
+                    matches |= set.intersection(*(self.by_venue_word.get(word, set()) for word in words))
+            candidates = matches if candidates is None else candidates & matches
+
+        if min_year is not None or max_year is not None:
+            low = min_year if min_year is not None else min(self.by_year, default=0)
+            high = max_year if max_year is not None else max(self.by_year, default=0)
+            matches = set().union(*(self.by_year.get(year, set()) for year in range(low, high + 1)))
+            candidates = matches if candidates is None else candidates & matches
+
+        if candidates is None:
+            candidates = set(self.publications)
+
+        if ids:
+            ordered = [pub_id for pub_id in ids if pub_id in candidates]
+        else:
+            ordered = sorted(candidates, key=lambda pub_id: (-(self.publications[pub_id].get("year") or 0), self.order[pub_id]))
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [(pub_id, self.publications[pub_id]) for pub_id in ordered]
+
+
+@lru_cache(maxsize=8)
+def _load_index(path: str, mtime_ns: int) -> PublicationIndex:
+    with open(path, "r", encoding="utf-8") as f:
+        return PublicationIndex(json.load(f).get("publications", {}))
+
+
+def load_index(path: str) -> PublicationIndex:
+    """Indexed catalog, reloaded only when the file changes."""
+    return _load_index(path, os.stat(path).st_mtime_ns)
+
+
+def data_path(filters: Dict[str, str], base_dir: Optional[str] = None) -> str:
+    """Catalog a directive reads, relative to base_dir (default: this script's directory)."""
+    base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_dir, filters.get("data", DATA_FILE))
+
+
+def select(filters: Dict[str, str], base_dir: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """Publications selected by a directive's filters."""
+    def split(key):
+        return [value.strip() for value in filters[key].split(",") if value.strip()] if key in filters else None
+
+    year = filters.get("year")
+    return load_index(data_path(filters, base_dir)).select(
+        ids=split("ids"),
+        venues=split("venue"),
+        min_year=int(year or filters.get("minYear", 0)) or None,
+        max_year=int(year or filters.get("maxYear", 0)) or None,
+        limit=int(filters["limit"]) if "limit" in filters else None,
+    )
+
+
+def publication_item(pub: Dict[str, Any]) -> ListItem:
+    """One resume bullet: **Title (year)** | [Venue year](link)."""
+    year = pub.get("year")
+    title = pub.get("title", "")
+    inlines = [Strong([Text(f"{title} ({year})" if year else title)])]
+
+    venue = pub.get("venue") or ""
+    # Don't repeat a year the venue already names ("NeurIPS 2023")
+    label = venue if year and str(year) in venue else " ".join(str(part) for part in (venue, year) if part)
+    links = pub.get("links") or {}
+    url = links.get("arxiv") or links.get("paper") or links.get("website")
+    if label:
+        inlines.append(Text(" | "))
+        inlines.append(Link([Text(label)], url) if url else Text(label))
+    return ListItem(inlines, [])
+
+
+def expand(document: Document, base_dir: Optional[str] = None) -> Document:
+    """Replace publications directives with bullet lists built from the catalog."""
+    if not any(isinstance(block, Publications) for block in document.blocks):
+        return document
+    blocks = [
+        BulletList([publication_item(pub) for _, pub in select(block.filters, base_dir)])
+        if isinstance(block, Publications) else block
+        for block in document.blocks
+    ]
+    return Document(document.meta, blocks)
+
+
+def fingerprint(document: Document, base_dir: Optional[str] = None) -> str:
+    """Hash of the publications a document's directives select ("" if it has none).
+
+    Renderers add this to their cache keys, so a catalog change only
+    invalidates resumes (and sections) whose selected entries changed.
+    """
+    selections = [
+        [publication_item(pub) for _, pub in select(block.filters, base_dir)]
+        for block in document.blocks if isinstance(block, Publications)
+    ]
+    if not selections:
+        return ""
+    return hashlib.sha256(json.dumps(selections, sort_keys=True).encode("utf-8")).hexdigest()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Record and replay Google Scholar responses, for offline fetch_scholar.py runs.
+
+Usage:
+    python fetch_scholar.py --record scholar_fixture.json     # live run, saving every response
+    python fetch_scholar.py --replay scholar_fixture.json     # same run, offline
+    python scholar_replay.py                                  # time a fetch over 1,000 synthetic papers
+    python scholar_replay.py scholar_fixture.json --latency 0.05 --error-rate 0.02
+
+A fixture holds the filled author profiles and filled publications that
+`scholarly.search_author_id`/`scholarly.fill` returned:
+
+    {"authors": {author_id: profile}, "publications": {key: publication}}
+
+`Replay` serves a fixture through the same two methods, with optional
+per-call latency and randomly injected errors (seeded, so runs repeat), so
+fetch_publications and its ID matching can be exercised in seconds.
+
+`Replay` stands in for the `scholarly` client inside the process; it is not
+an HTTP server. scholarly builds its own requests to scholar.google.com and
+parses the returned HTML, and a fixture stores the already-parsed results,
+so there are no pages to serve locally. Replay runs therefore cover
+fetch_scholar.py's logic but not scholarly's HTTP session, its timeouts or
+its HTML parsing; only a live run (or --record) exercises those.
+"""
+
+import argparse
+import contextlib
+import copy
+import enum
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import atomic_output
+
+
+SYNTHETIC_AUTHOR_ID = "SYNTHETIC01"
+
+_WORDS = [
+    "audio", "speech", "music", "flow", "diffusion", "token", "language", "model", "alignment",
+    "vocoder", "singing", "prosody", "latent", "transformer", "codec", "retrieval", "reasoning",
+]
+_VENUES = ["ICLR", "NeurIPS", "ICML", "ICASSP", "Interspeech", "arXiv preprint"]
+
+
+class ReplayError(Exception):
+    """A call the fixture cannot answer, or an injected failure."""
+
+
+def pub_key(pub: Dict[str, Any]) -> str:
+    """Fixture key of a publication: its Scholar ID, or its title if it has none."""
+    return pub.get("author_pub_id") or "title:" + pub.get("bib", {}).get("title", "").lower()
+
+
+def _plain(value: Any) -> Any:
+    """JSON-safe copy of a scholarly result (enums become their names)."""
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_plain(item) for item in value]
+    if isinstance(value, enum.Enum):
+        return value.name
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def load_fixture(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        fixture = json.load(f)
+    return {"authors": fixture.get("authors", {}), "publications": fixture.get("publications", {})}
+
+
+class Recorder:
+    """Pass calls through to a live client and keep every filled response."""
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.fixture: Dict[str, Dict[str, Any]] = {"authors": {}, "publications": {}}
+        self._lock = threading.Lock()
+
+    def search_author_id(self, author_id: str) -> Any:
+        return self.client.search_author_id(author_id)
+
+    def fill(self, obj: Any, sections: Optional[list] = None) -> Any:
+        result = self.client.fill(obj, sections=sections) if sections else self.client.fill(obj)
+        with self._lock:
+            if result.get("container_type") == "Author":
+                self.fixture["authors"][result["scholar_id"]] = _plain(result)
+            else:
+                self.fixture["publications"][pub_key(result)] = _plain(result)
+        return result
+
+    def save(self, path: str) -> None:
+        with self._lock:
+            atomic_output.write_json(path, self.fixture, sort_keys=True)
+
+
+class Replay:
+    """Answer search_author_id/fill from a fixture instead of Google Scholar.
+
+    Every call sleeps `latency` seconds and fails with probability
+    `error_rate`, like a slow or flaky Scholar. Both are simulated in process:
+    no socket is opened, so network timeouts are not exercised.
+    """
+
+    def __init__(self, fixture: Dict[str, Dict[str, Any]], latency: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.fixture = fixture
+        self.latency = latency
+        self.error_rate = error_rate
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _call(self) -> None:
+        with self._lock:
+            self.calls += 1
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            raise ReplayError("injected error")
+
+    def search_author_id(self, author_id: str) -> Dict[str, Any]:
+        self._call()
+        if author_id not in self.fixture["authors"]:
+            raise ReplayError(f"author {author_id} not in fixture")
+        return {"container_type": "Author", "scholar_id": author_id, "filled": []}
+
+    def fill(self, obj: Dict[str, Any], sections: Optional[list] = None) -> Dict[str, Any]:
+        self._call()
+        if obj.get("container_type") == "Author":
+            table, key = self.fixture["authors"], obj["scholar_id"]
+        else:
+            table, key = self.fixture["publications"], pub_key(obj)
+        if key not in table:
+            raise ReplayError(f"{key} not in fixture")
+        return copy.deepcopy(table[key])
+
+
+def synthetic_fixture(count: int = 1000, author_id: str = SYNTHETIC_AUTHOR_ID, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """A made-up profile with `count` publications, in fixture form."""
+    rng = random.Random(seed)
+    listings = []
+    publications = {}
+    for i in range(count):
+        words = rng.sample(_WORDS, 4)
+        title = f"{words[0].capitalize()}{i}: {' '.join(words[1:]).capitalize()} at scale"
+        year = rng.randint(2012, 2025)
+        citations = int(rng.paretovariate(1.2)) - 1
+        listing = {
+            "container_type": "Publication",
+            "source": "AUTHOR_PUBLICATION_ENTRY",
+            "author_pub_id": f"{author_id}:{i:05d}",
+            "num_citations": citations,
+            "filled": False,
+            "bib": {"title": title, "pub_year": str(year), "citation": f"{rng.choice(_VENUES)}, {year}"},
+        }
+        listings.append(listing)
+
+        filled = copy.deepcopy(listing)
+        filled["filled"] = True
+        filled["bib"].update({
+            "author": " and ".join(["Rafael Valle"] + [f"Author {rng.randint(1, 300)}" for _ in range(rng.randint(1, 8))]),
+            "venue": rng.choice(_VENUES),
+            "abstract": f"We study {' and '.join(words)}.",
+        })
+        if rng.random() < 0.6:
+            filled["pub_url"] = f"https://arxiv.org/abs/{year % 100:02d}{rng.randint(1, 12):02d}.{i:05d}"
+        publications[pub_key(filled)] = filled
+
+    profile = {
+        "container_type": "Author",
+        "scholar_id": author_id,
+        "name": "Synthetic Author",
+        "filled": ["publications"],
+        "publications": listings,
+    }
+    return {"authors": {author_id: profile}, "publications": publications}
+
+
+def benchmark(fixture: Dict[str, Dict[str, Any]], workers: int, latency: float, error_rate: float, seed: int = 0, verbose: bool = False) -> Dict[str, Any]:
+    """Run fetch_publications over a fixture with a fresh journal and registry.
+
+    A run that stops with ScholarBlocked or ProfileFetchError is reported,
+    not raised: "blocked" holds the reason, and "fetched"/"failed" count the
+    journal's records.
+    """
+    import fetch_scholar  # Imported here: fetch_scholar imports this module
+
+    client = Replay(fixture, latency=latency, error_rate=error_rate, seed=seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        journal = fetch_scholar.FetchJournal(os.path.join(tmp_dir, "journal.jsonl"))
+        publications, new_ids, blocked = {}, [], None
+        start = time.perf_counter()
+        with contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO()):
+            try:
+                publications, new_ids, _, _ = fetch_scholar.fetch_publications(
+                    {}, {}, list(fixture["authors"]), journal, workers=workers, delay=0.0, client=client
+                )
+            except (fetch_scholar.ScholarBlocked, fetch_scholar.ProfileFetchError) as e:
+                blocked = str(e)
+        elapsed = time.perf_counter() - start
+        fetched = sum(1 for record in journal.records.values() if record["ok"])
+        failed = sum(1 for record in journal.records.values() if not record["ok"])
+    return {
+        "seconds": elapsed, "publications": len(publications), "new": len(new_ids),
+        "fetched": fetched, "failed": failed, "calls": client.calls, "blocked": blocked,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time fetch_scholar.py against recorded or synthetic Scholar responses.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python scholar_replay.py
+    python scholar_replay.py --count 5000 --workers 16
+    python scholar_replay.py scholar_fixture.json --latency 0.05 --error-rate 0.02
+    python scholar_replay.py --write-synthetic synthetic_fixture.json
+        """
+    )
+    parser.add_argument(
+        "fixture",
+        nargs="?",
+        help="Fixture recorded with fetch_scholar.py --record (default: a synthetic profile)"
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=1000,
+        help="Publications in the synthetic profile (default: 1000)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent requests, as in fetch_scholar.py (default: 4)"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds each simulated request takes (default: 0)"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of simulated requests that fail (default: 0)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for the synthetic profile and injected errors (default: 0)"
+    )
+    parser.add_argument(
+        "--write-synthetic",
+        metavar="PATH",
+        help="Save the synthetic profile as a fixture and exit"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show fetch_scholar.py's output"
+    )
+    args = parser.parse_args()
+
+    fixture = load_fixture(args.fixture) if args.fixture else synthetic_fixture(args.count, seed=args.seed)
+
+    if args.write_synthetic:
+        atomic_output.write_json(args.write_synthetic, fixture, sort_keys=True)
+        print(f"Wrote {len(fixture['publications'])} publications to {args.write_synthetic}")
+        return
+
+    source = args.fixture or f"synthetic profile ({args.count} publications)"
+    print(f"Replaying {source} with {args.workers} workers, "
+          f"{args.latency * 1000:g} ms latency, {args.error_rate:.0%} errors...")
+    result = benchmark(fixture, args.workers, args.latency, args.error_rate, args.seed, args.verbose)
+    if result["blocked"]:
+        print(f"  Blocked ({result['blocked']}) after {result['fetched']} publications ({result['failed']} failed) "
+              f"in {result['seconds']:.2f}s, {result['calls']} requests")
+        return
+    print(f"  {result['publications']} publications ({result['new']} new, {result['failed']} failed) "
+          f"in {result['seconds']:.2f}s, {result['calls']} requests")
+
+
+if __name__ == "__main__":
+    main()
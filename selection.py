@@ -0,0 +1,144 @@
+"""
+Ordering and selection policies for publication sections.
+
+A publications section in site.json either lists its `entries` by hand or
+declares a `policy` that picks them from the data file:
+
+    {
+      "type": "publications",
+      "entries": ["FUGATTO"],                 # pinned: always shown, first, in this order
+      "policy": {
+        "sort": "citations",                  # "year" (default), "citations" or "venue_tier"
+        "limit": 50,                          # at most this many entries, pins included
+        "topPerYear": 3,                      # keep only the best N of each year
+        "minYear": 2018,                      # drop older publications
+        "exclude": ["OLD_DRAFT"],
+        "venueTiers": {"NeurIPS": 1, "ICML": 1, "ICLR": 1, "ICASSP": 2}
+      }
+    }
+
+Sort keys are computed once per publication, and `limit` / `topPerYear` use
+bounded heaps, so picking the top K of N publications costs O(N log K).
+"""
+
+import heapq
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+SORTS = ("year", "citations", "venue_tier")
+
+
+def year_key(pub: Dict[str, Any]) -> Tuple[bool, int]:
+    """Most recent first; publications without a year go last."""
+    year = pub.get("year")
+    return (year is None, -(year or 0))
+
+
+def citation_count(pub_id: str, pub: Dict[str, Any], citations: Dict[str, int]) -> int:
+    """Citation count from the citation store, falling back to Scholar's `_citations`."""
+    count = citations.get(pub_id)
+    if count is None:
+        count = pub.get("_citations") or 0
+    return count
+
+
+def venue_tier_matcher(tiers: Dict[str, int]) -> Callable[[str], int]:
+    """Return venue -> tier (lower is better).
+
+    A tier name matches when it appears as a word in the venue, case-insensitively
+    ("arXiv 2019 - ICLR 2020" matches "ICLR"); the best matching tier wins.
+    Unlisted venues rank after every listed tier.
+    """
+    patterns = [
+        (tier, re.compile(r"\b" + re.escape(name) + r"\b", re.IGNORECASE))
+        for name, tier in sorted(tiers.items(), key=lambda item: item[1])
+    ]
+    unranked = max(tiers.values(), default=0) + 1
+
+    def match(venue: str) -> int:
+        for tier, pattern in patterns:
+            if pattern.search(venue or ""):
+                return tier
+        return unranked
+
+    return match
+
+
+def sort_keys(
+    publications: Iterable[Tuple[str, Dict[str, Any]]],
+    policy: Dict[str, Any],
+    citations: Dict[str, int],
+) -> Dict[str, tuple]:
+    """Precompute the policy's sort key for each publication (smaller sorts first).
+
+    The publication ID is the final tie-breaker, so the order is deterministic.
+    """
+    sort = policy.get("sort", "year")
+    if sort not in SORTS:
+        raise ValueError(f"Unknown sort policy {sort!r} (expected one of {', '.join(SORTS)})")
+    tier = venue_tier_matcher(policy.get("venueTiers", {}))
+
+    keys = {}
+    for pub_id, pub in publications:
+        count = citation_count(pub_id, pub, citations)
+        if sort == "year":
+            keys[pub_id] = (*year_key(pub), -count, pub_id)
+        elif sort == "citations":
+            keys[pub_id] = (-count, *year_key(pub), pub_id)
+        else:
+            keys[pub_id] = (tier(pub.get("venue", "")), *year_key(pub), -count, pub_id)
+    return keys
+
+
+def top_per_year(keys: Dict[str, tuple], publications: Dict[str, Any], per_year: int) -> Dict[str, tuple]:
+    """Keep only the `per_year` best-ranked publications of each year."""
+    by_year: Dict[Optional[int], List[str]] = {}
+    for pub_id in keys:
+        by_year.setdefault(publications[pub_id].get("year"), []).append(pub_id)
+    kept = {}
+    for pub_ids in by_year.values():
+        for pub_id in heapq.nsmallest(per_year, pub_ids, key=keys.__getitem__):
+            kept[pub_id] = keys[pub_id]
+    return kept
+
+
+def select_entries(
+    section: Dict[str, Any],
+    publications: Dict[str, Any],
+    citations: Optional[Dict[str, int]] = None,
+) -> List[str]:
+    """Publication IDs to show in a section, in display order.
+
+    Sections without a `policy` use their `entries` as-is. With a policy,
+    `entries` are pins: they are always shown, first, and count toward `limit`.
+    """
+    entries = section.get("entries", [])
+    policy = section.get("policy")
+    if not policy:
+        return entries
+
+    pins = [pub_id for pub_id in entries if pub_id in publications]
+    pinned = set(pins)
+    excluded = set(policy.get("exclude", []))
+    min_year = policy.get("minYear")
+
+    candidates = (
+        (pub_id, pub) for pub_id, pub in publications.items()
+        if pub_id not in pinned
+        and pub_id not in excluded
+        and (min_year is None or (pub.get("year") or 0) >= min_year)
+    )
+    keys = sort_keys(candidates, policy, citations or {})
+
+    per_year = policy.get("topPerYear")
+    if per_year is not None:
+        keys = top_per_year(keys, publications, per_year)
+
+    limit = policy.get("limit")
+    if limit is None:
+        ranked = sorted(keys, key=keys.__getitem__)
+    else:
+        ranked = heapq.nsmallest(max(limit - len(pins), 0), keys, key=keys.__getitem__)
+
+    return pins + ranked
@@ -2,49 +2,87 @@
 """
 Simple script to view a markdown file in your browser.
 Usage: python view_resume.py [path/to/resume.md]
+       python view_resume.py resume.md --serve    # live preview, refreshes on save
 """
 
+import argparse
+import html
+import re
 import sys
+import threading
+import time
 import webbrowser
 import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import atomic_output
+import resume_markdown
+import resume_publications
+from resume_markdown import BulletList, Emphasis, Heading, Paragraph, Strong, Text
+
+def inline_html(inlines):
+    """Render parsed inline markup as HTML."""
+    parts = []
+    for node in inlines:
+        if isinstance(node, Text):
+            parts.append(html.escape(node.text, quote=False))
+        elif isinstance(node, Strong):
+            parts.append(f'<strong>{inline_html(node.children)}</strong>')
+        elif isinstance(node, Emphasis):
+            parts.append(f'<em>{inline_html(node.children)}</em>')
+        else:
+            parts.append(f'<a href="{html.escape(node.url)}">{inline_html(node.children)}</a>')
+    return ''.join(parts)
+
+
+def list_html(items):
+    """Render (nested) list items as HTML."""
+    parts = ['<ul>']
+    for item in items:
+        children = list_html(item.children) if item.children else ''
+        parts.append(f'<li>{inline_html(item.inlines)}{children}</li>')
+    parts.append('</ul>')
+    return ''.join(parts)
+
+
+def block_html(block):
+    """Render one parsed block as HTML."""
+    if isinstance(block, Heading):
+        return f'<h{block.level}>{inline_html(block.inlines)}</h{block.level}>'
+    if isinstance(block, BulletList):
+        return list_html(block.items)
+    if isinstance(block, Paragraph):
+        return '<p>' + '<br>\n'.join(inline_html(line) for line in block.lines) + '</p>'
+    return '<hr>'
+
+
 def markdown_to_html(md_content):
     """Convert markdown to HTML with nice styling."""
-    
-    # Simple markdown to HTML conversion
-    html = md_content
-    
-    # Headers
-    html = html.replace('# ', '<h1>').replace('\n## ', '</h1>\n<h2>').replace('\n### ', '</h2>\n<h3>').replace('\n#### ', '</h3>\n<h4>')
-    
-    # Bold
-    import re
-    html = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', html)
-    
-    # Links
-    html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
-    
-    # Line breaks
-    html = html.replace('\n\n', '</p><p>')
-    html = html.replace('\n- ', '<li>').replace('\n  - ', '<li style="margin-left: 20px;">')
-    
-    # Wrap in paragraphs
-    html = '<p>' + html + '</p>'
-    
-    # Close any open headers
-    html = html.replace('<h1>', '<h1>').replace('\n<h2>', '</h1>\n<h2>')
-    html = html.replace('<h2>', '<h2>').replace('\n<h3>', '</h2>\n<h3>')
-    html = html.replace('<h3>', '<h3>').replace('\n<h4>', '</h3>\n<h4>')
-    html = html.replace('<h4>', '<h4>').replace('\n<p>', '</h4>\n<p>')
-    
-    return html
+    return document_to_html(resume_markdown.parse(md_content))
+
+
+def document_to_html(document):
+    """Render a parsed resume as HTML body content."""
+    document = resume_publications.expand(document)
+    parts = []
+    # Front matter (resume.md) carries the name and title instead of a "# Name" heading
+    if document.meta.get('name'):
+        parts.append(f'<h1>{html.escape(document.meta["name"])}</h1>')
+    if document.meta.get('title'):
+        parts.append(f'<p><strong>{html.escape(document.meta["title"])}</strong></p>')
+    parts.extend(block_html(block) for block in document.blocks)
+
+    return '\n'.join(parts)
+
 
 def create_html_page(md_content):
     """Create a full HTML page with styling."""
-    
-    body_content = markdown_to_html(md_content)
-    
+    return html_page(markdown_to_html(md_content))
+
+
+def html_page(body_content):
+    """Wrap rendered body content in the styled page template."""
     html_template = f"""<!DOCTYPE html>
 <html>
 <head>
@@ -103,6 +141,10 @@ def create_html_page(md_content):
         a:hover {{
             text-decoration: underline;
         }}
+        ul {{
+            margin: 0;
+            padding-left: 20px;
+        }}
         li {{
             margin: 0.5em 0;
             list-style-type: none;
@@ -134,44 +176,200 @@ def create_html_page(md_content):
     
     return html_template
 
+PUBLICATIONS_DIRECTIVE = '<!-- publications'
+
+
+class SectionRenderer:
+    """Render markdown section by section, reusing the HTML of unchanged sections.
+
+    Sections are split at "## " headings (blocks never span them), and keyed
+    by their text, so an edit only re-parses the section it touches.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def render(self, md_content):
+        sections = re.split(r'(?m)^(?=## )', md_content)
+        cache = {}
+        parts = []
+        for index, section in enumerate(sections):
+            key = (index == 0, section)  # Only the first section may hold front matter
+            if PUBLICATIONS_DIRECTIVE in section:
+                # Generated lists also depend on the catalog's selected entries
+                key += (resume_publications.fingerprint(resume_markdown.parse(section)),)
+            body = self._cache.get(key)
+            if body is None:
+                body = markdown_to_html(section)
+            cache[key] = body
+            if body:
+                parts.append(body)
+        self._cache = cache  # Drop sections that no longer exist
+        return '\n'.join(parts)
+
+
+LIVE_RELOAD_SCRIPT = """<script>
+new EventSource('/events').onmessage = function () {
+    fetch('/body').then(function (response) { return response.text(); }).then(function (body) {
+        document.getElementById('resume').innerHTML = body;
+    });
+};
+</script>"""
+
+
+class PreviewState:
+    """The latest rendered body, with a version counter clients wait on."""
+
+    def __init__(self, md_file):
+        self.md_file = md_file
+        self.renderer = SectionRenderer()
+        self.changed = threading.Condition()
+        self.version = 0
+        self.body = ''
+        self.mtime = None
+
+    def refresh(self):
+        """Re-render if the file changed; returns True when the body changed."""
+        try:
+            # data.json feeds generated publication lists, so watch it too
+            data_file = Path(resume_publications.data_path({}))
+            mtime = (self.md_file.stat().st_mtime_ns, data_file.stat().st_mtime_ns if data_file.exists() else None)
+        except FileNotFoundError:
+            return False
+        if mtime == self.mtime:
+            return False
+        self.mtime = mtime
+        body = self.renderer.render(self.md_file.read_text(encoding='utf-8'))
+        if body == self.body:
+            return False
+        with self.changed:
+            self.body = body
+            self.version += 1
+            self.changed.notify_all()
+        return True
+
+    def watch(self, interval):
+        """Poll the markdown file for changes (runs in a daemon thread)."""
+        while True:
+            time.sleep(interval)
+            if self.refresh():
+                print(f'Re-rendered {self.md_file.name}')
+
+
+def make_handler(state):
+    class PreviewHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/':
+                page = html_page(f'<div id="resume">{state.body}</div>\n{LIVE_RELOAD_SCRIPT}')
+                self.send_text(page)
+            elif self.path == '/body':
+                self.send_text(state.body)
+            elif self.path == '/events':
+                self.stream_events()
+            else:
+                self.send_error(404)
+
+        def send_text(self, text):
+            data = text.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(data)
+
+        def stream_events(self):
+            """Server-sent events: one message per re-render, keepalives in between."""
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            seen = state.version
+            try:
+                while True:
+                    with state.changed:
+                        state.changed.wait_for(lambda: state.version != seen, timeout=15)
+                        version = state.version
+                    if version != seen:
+                        seen = version
+                        self.wfile.write(f'data: {version}\n\n'.encode())
+                    else:
+                        self.wfile.write(b': keepalive\n\n')
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, format, *args):
+            pass  # Keep the console for re-render messages
+
+    return PreviewHandler
+
+
+def serve(md_file, port, interval=0.5):
+    """Serve a live preview of md_file, pushing updates to open tabs."""
+    state = PreviewState(md_file)
+    state.refresh()
+    threading.Thread(target=state.watch, args=(interval,), daemon=True).start()
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(state))
+    server.daemon_threads = True
+    url = f'http://127.0.0.1:{server.server_port}/'
+    print(f'Previewing {md_file.name} at {url} (Ctrl+C to stop)')
+    webbrowser.open(url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def find_default_file():
+    """resume_updated.md or resume.md, whichever exists first."""
+    for candidate in (Path('/mnt/user-data/outputs/resume_updated.md'), Path('resume_updated.md'), Path('resume.md')):
+        if candidate.exists():
+            return candidate
+    return None
+
+
 def main():
+    parser = argparse.ArgumentParser(description='View a resume markdown file in your browser.')
+    parser.add_argument('md_file', nargs='?', help='Markdown file (default: resume_updated.md or resume.md)')
+    parser.add_argument('--serve', action='store_true', help='Run a live-preview server that re-renders on save')
+    parser.add_argument('--port', type=int, default=8001, help='Preview server port (default: 8001)')
+    args = parser.parse_args()
+
     # Get the markdown file path
-    if len(sys.argv) > 1:
-        md_file = Path(sys.argv[1])
-    else:
-        # Default to resume_updated.md in current directory or outputs
-        if Path('/mnt/user-data/outputs/resume_updated.md').exists():
-            md_file = Path('/mnt/user-data/outputs/resume_updated.md')
-        elif Path('resume_updated.md').exists():
-            md_file = Path('resume_updated.md')
-        elif Path('resume.md').exists():
-            md_file = Path('resume.md')
-        else:
-            print("Error: No markdown file found.")
-            print("Usage: python view_resume.py [path/to/resume.md]")
-            sys.exit(1)
-    
+    md_file = Path(args.md_file) if args.md_file else find_default_file()
+    if md_file is None:
+        print("Error: No markdown file found.")
+        print("Usage: python view_resume.py [path/to/resume.md]")
+        sys.exit(1)
+
     if not md_file.exists():
         print(f"Error: File not found: {md_file}")
         sys.exit(1)
-    
+
+    if args.serve:
+        serve(md_file, args.port)
+        return
+
     # Read the markdown file
     with open(md_file, 'r', encoding='utf-8') as f:
         md_content = f.read()
-    
+
     # Create HTML
     html_content = create_html_page(md_content)
-    
-    # Write to temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-        f.write(html_content)
-        temp_path = f.name
-    
+
+    # Write to one preview file per resume, overwritten on each run
+    temp_path = Path(tempfile.gettempdir()) / f'view_resume-{md_file.stem}.html'
+    atomic_output.write_text(str(temp_path), html_content)
+
     print(f"Opening {md_file.name} in your browser...")
-    print(f"Temporary HTML file: {temp_path}")
-    
+    print(f"Preview file: {temp_path}")
+
     # Open in browser
-    webbrowser.open(f'file://{temp_path}')
+    webbrowser.open(temp_path.as_uri())
 
 if __name__ == '__main__':
     main()